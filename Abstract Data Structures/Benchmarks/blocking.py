@@ -0,0 +1,94 @@
+import queue
+import sys
+import threading
+import time
+
+from suite import load_class
+
+BlockingQueue = load_class('Queue', 'queue', 'BlockingQueue')
+BATCH = 100
+
+
+def produce(put, items):
+    """
+    Puts items values, one at a time.
+    """
+    for i in range(items):
+        put(i)
+
+
+def consume(get, items):
+    """
+    Gets items values, one at a time.
+    """
+    for _ in range(items):
+        get()
+
+
+def consume_many(get_many, items):
+    """
+    Gets items values, up to BATCH at a time.
+    """
+    while items > 0:
+        items -= len(get_many(min(BATCH, items)))
+
+
+def throughput(make_queue, consumer, get_name, items, producers, consumers, maxsize):
+    """
+    Runs the given amount of producer and consumer threads sharing a queue
+    created by make_queue(maxsize), moving items values from the first
+    ones to the second ones, and returns the values moved per second.
+
+    consumer is the function the consumers run with the queue method named
+    get_name.
+    """
+    q = make_queue(maxsize)
+    workers = [threading.Thread(target=produce, args=(q.put, items // producers))
+               for _ in range(producers)]
+    workers += [threading.Thread(target=consumer, args=(getattr(q, get_name), items // consumers))
+                for _ in range(consumers)]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return items / (time.perf_counter() - start)
+
+
+def run(items=200000, maxsize=1000, shapes=((1, 1), (2, 2), (4, 4), (8, 1))):
+    """
+    Prints the values per second moved through queue.Queue, BlockingQueue
+    with get() and BlockingQueue with get_many(), for each amount of
+    producers and consumers in shapes.
+    """
+    results = {}
+    contenders = (
+        ('queue.Queue', lambda maxsize: queue.Queue(maxsize), consume, 'get'),
+        ('BlockingQueue', lambda maxsize: BlockingQueue(maxsize=maxsize), consume, 'get'),
+        ('get_many', lambda maxsize: BlockingQueue(maxsize=maxsize), consume_many, 'get_many'),
+    )
+
+    print(f'Values per second, {items} values, maxsize {maxsize}'.center(80))
+    print('-' * 80)
+    print(f'{"producers/consumers":<20}' + ''.join([f'{name:>15}' for name, *_ in contenders]) +
+          f'{"ratio":>15}')
+    print('-' * 80)
+
+    for producers, consumers in shapes:
+        timings = [throughput(make_queue, consumer, get_name, items, producers, consumers, maxsize)
+                   for _, make_queue, consumer, get_name in contenders]
+        results[producers, consumers] = timings
+        print(f'{f"{producers}/{consumers}":<20}' + ''.join([f'{timing:>15.0f}' for timing in timings]) +
+              f'{timings[1] / timings[0]:>14.2f}x')
+
+    print('-' * 80)
+    return results
+
+
+if __name__ == '__main__':
+
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    run(items)
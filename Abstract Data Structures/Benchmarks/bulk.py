@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'SortedSinglyLinkedList'))
+
+from sortedSinglyLL import SortedSinglyLL
+
+
+def timed(function):
+    """
+    Calls function with no arguments and returns the seconds it took.
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def append_one_by_one(values):
+    ssll = SortedSinglyLL()
+
+    for value in values:
+        ssll.append(value)
+
+    return ssll
+
+
+def insert_one_by_one(ssll, position, values):
+    # Inserting them backwards at the same position leaves them in order.
+    for value in reversed(values):
+        ssll.insert(value, position)
+
+
+def clone_one_by_one(ssll):
+    clone = SortedSinglyLL()
+
+    for value in ssll:
+        clone.append(value)
+
+    return clone
+
+
+def run(n=1000000, k=100):
+    """
+    Compares the throughput (items per second) of the per-element path
+    against the bulk one for each operation, building lists of n items.
+    
+    Insertions in the middle of the list add k items to a list of n 
+    items, since the per-element path reindexes the list on each one.
+    """
+    values = list(range(n))
+    extra = list(range(k))
+    ssll = SortedSinglyLL.from_iterable(values)
+    rows = (
+        ('build', n,
+            lambda: append_one_by_one(values),
+            lambda: SortedSinglyLL.from_iterable(values)),
+        ('extend', n,
+            lambda: append_one_by_one(values),
+            lambda: SortedSinglyLL().extend(values)),
+        ('insert at start', n,
+            lambda: insert_one_by_one(SortedSinglyLL(0), 0, values),
+            lambda: SortedSinglyLL(0).insert_many(0, values)),
+        ('insert in the middle', k,
+            lambda: insert_one_by_one(ssll, n // 2, extra),
+            lambda: ssll.insert_many(n // 2, extra)),
+        ('clone', n,
+            lambda: clone_one_by_one(ssll),
+            lambda: ssll.clone()),
+    )
+    results = {}
+
+    print(f'Items per second, n = {n}'.center(70))
+    print('-' * 70)
+    print(f'{"operation":<25}{"per element":>15}{"bulk":>15}{"speedup":>15}')
+    print('-' * 70)
+
+    for name, items, one_by_one, bulk in rows:
+        slow = items / timed(one_by_one)
+        fast = items / timed(bulk)
+        results[name] = (slow, fast)
+        print(f'{name:<25}{slow:>15.0f}{fast:>15.0f}{fast / slow:>14.2f}x')
+
+    print('-' * 70)
+    return results
+
+
+if __name__ == '__main__':
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
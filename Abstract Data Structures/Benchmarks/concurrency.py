@@ -0,0 +1,116 @@
+import os
+import random
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'SortedSinglyLinkedList'))
+
+from sortedSinglyLL import SortedSinglyLL
+from concurrentSinglyLL import ConcurrentSortedSinglyLL
+
+
+class GlobalLockSSLL:
+    """
+    The baseline: a SortedSinglyLL with every call wrapped in one lock,
+    which is how lists were shared between threads before.
+    """
+    def __init__(self, *args, **kwargs):
+        self._ssll = SortedSinglyLL(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ssll)
+
+    def __getattr__(self, name):
+        method = getattr(self._ssll, name)
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return locked
+
+
+def at_the_ends(ssll, thread, ops, rng):
+    """
+    Even threads push and pop at the head, odd ones at the tail.
+    """
+    push, pop, end = (ssll.prepend, ssll.pop, 0) if thread % 2 == 0 else \
+        (ssll.append, ssll.pop, None)
+
+    for i in range(ops):
+        if rng.random() < 0.5:
+            push(i)
+        elif len(ssll) > 1:
+            pop(end)
+
+
+def read_mostly(ssll, thread, ops, rng):
+    """
+    Nine lookups by index for every push or pop at the tail. Each thread
+    alternates pushes and pops, so the list keeps its length.
+    """
+    lookups = len(ssll) // 2
+
+    for i in range(ops):
+        if rng.random() < 0.9:
+            ssll.valueOf(rng.randrange(lookups))
+        elif i % 2:
+            ssll.append(i)
+        else:
+            ssll.pop()
+
+
+def stress(list_class, workload, threads, ops, size):
+    """
+    Runs the workload on a list_class holding size values, with ops
+    operations split between the given amount of threads, and returns
+    the operations per second.
+    """
+    ssll = list_class(*range(size), express_lanes=True)
+    per_thread = ops // threads
+    workers = [threading.Thread(target=workload, args=(ssll, i, per_thread, random.Random(i)))
+               for i in range(threads)]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def run(ops=200000, size=1000, thread_counts=(1, 2, 4, 8)):
+    """
+    Prints the operations per second of each workload, for the global
+    lock baseline and ConcurrentSortedSinglyLL, as the amount of threads
+    sharing the list grows.
+    """
+    results = {}
+
+    print(f'Operations per second, {ops} operations on {size} values'.center(70))
+
+    for workload in (at_the_ends, read_mostly):
+        print('-' * 70)
+        print(f'{workload.__name__:<25}{"global lock":>15}{"concurrent":>15}{"ratio":>15}')
+        print('-' * 70)
+
+        for threads in thread_counts:
+            baseline = stress(GlobalLockSSLL, workload, threads, ops, size)
+            concurrent = stress(ConcurrentSortedSinglyLL, workload, threads, ops, size)
+            results[workload.__name__, threads] = (baseline, concurrent)
+            print(f'{str(threads) + " threads":<25}{baseline:>15.0f}{concurrent:>15.0f}'
+                  f'{concurrent / baseline:>14.2f}x')
+
+    print('-' * 70)
+    return results
+
+
+if __name__ == '__main__':
+
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    run(ops)
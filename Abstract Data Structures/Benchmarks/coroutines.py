@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import time
+
+from suite import load_class
+
+AsyncQueue = load_class('Queue', 'queue', 'AsyncQueue')
+AsyncBPQueue = load_class('BoundedPriorityQueue', 'bpqueue', 'AsyncBPQueue')
+LEVELS = 10
+
+
+class PriorityAdapter:
+    """
+    Gives asyncio.PriorityQueue the put(value, priority_level) signature
+    of AsyncBPQueue. Entries carry a counter so equal priorities keep
+    their order, as they do in a BPQueue.
+    """
+    def __init__(self, maxsize):
+        self._queue = asyncio.PriorityQueue(maxsize)
+        self._count = 0
+
+    async def put(self, value, priority_level):
+        self._count += 1
+        await self._queue.put((priority_level, self._count, value))
+
+    async def get(self):
+        return (await self._queue.get())[2]
+
+
+async def produce(put, items, prioritized):
+    """
+    Puts items values, spread across LEVELS priority levels if prioritized.
+    """
+    for i in range(items):
+        if prioritized:
+            await put(i, i % LEVELS)
+        else:
+            await put(i)
+
+
+async def consume(get, items):
+    """
+    Gets items values, one at a time.
+    """
+    for _ in range(items):
+        await get()
+
+
+async def throughput(queue, coroutines, items, prioritized):
+    """
+    Runs the given amount of producer and consumer coroutines sharing the
+    queue, each one putting or getting items values, and returns the
+    values moved per second.
+    """
+    tasks = [produce(queue.put, items, prioritized) for _ in range(coroutines)]
+    tasks += [consume(queue.get, items) for _ in range(coroutines)]
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return coroutines * items / (time.perf_counter() - start)
+
+
+def run(coroutines=10000, items=10, maxsize=1000):
+    """
+    Prints the values per second moved by coroutines producers and as many
+    consumers through asyncio.Queue and AsyncQueue, and through
+    asyncio.PriorityQueue and AsyncBPQueue, bounded to maxsize values.
+    """
+    contenders = (
+        ('asyncio.Queue', lambda: asyncio.Queue(maxsize), False),
+        ('AsyncQueue', lambda: AsyncQueue(maxsize=maxsize), False),
+        ('asyncio.PriorityQueue', lambda: PriorityAdapter(maxsize), True),
+        ('AsyncBPQueue', lambda: AsyncBPQueue(LEVELS - 1, maxsize=maxsize), True),
+    )
+    results = {}
+
+    print(f'{coroutines} producers and {coroutines} consumers, '
+          f'{items} values each, maxsize {maxsize}'.center(60))
+    print('-' * 60)
+    print(f'{"queue":<30}{"values per second":>30}')
+    print('-' * 60)
+
+    for name, make_queue, prioritized in contenders:
+        results[name] = asyncio.run(throughput(make_queue(), coroutines, items, prioritized))
+        print(f'{name:<30}{results[name]:>30.0f}')
+
+    print('-' * 60)
+    return results
+
+
+if __name__ == '__main__':
+
+    coroutines = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run(coroutines)
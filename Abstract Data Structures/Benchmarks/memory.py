@@ -0,0 +1,119 @@
+import os
+import sys
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'SortedSinglyLinkedList'))
+sys.path.insert(0, os.path.join(HERE, '..', 'MultiSortedCircularDoublyLinkedList'))
+
+from sortedSinglyLL import SSLL_Node
+from mscdll import MSCDLLNode, _MSCDLLLinks
+
+
+class DictSSLLNode:
+    """
+    A copy of the node layout SSLL_Node had before it used __slots__: 
+    an instance dictionary holding value, _idx and _next.
+    """
+    def __init__(self, value=None):
+        self.value = value
+        self._idx = None
+        self._next = None
+
+
+class DictMSCDLLNode:
+    """
+    A copy of the node layout MSCDLLNode had before it used __slots__: 
+    an instance dictionary holding value, _links and _id, where _links 
+    holds a dictionary with 'back' and 'next' per list.
+    """
+    def __init__(self, value):
+        self.value = value
+        self._links = {}
+        self._id = id(self)
+
+
+def bytes_per_node(build, n):
+    """
+    Calls build(n) and returns the number of bytes allocated while doing 
+    so, divided by n. The structure returned by build is kept alive until
+    the measure is taken.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return (after - before) / n
+
+
+def build_ssll_nodes(node_class):
+    """
+    Returns a function that creates n linked nodes of node_class, with 
+    their _idx set like a SortedSinglyLL would do it.
+    """
+    def build(n):
+        head = tail = node_class(0)
+        head._idx = 0
+
+        for i in range(1, n):
+            node = node_class(i)
+            node._idx = i
+            tail._next = node
+            tail = node
+
+        return head
+
+    return build
+
+
+def build_mscdll_nodes(node_class, links_class):
+    """
+    Returns a function that creates n nodes of node_class linked to each 
+    other in a single list, the same way a MSCDLL would do it.
+    """
+    def build(n):
+        nodes = [node_class(i) for i in range(n)]
+
+        for i, node in enumerate(nodes):
+            links = links_class()
+            links['back'] = nodes[i - 1]
+            links['next'] = nodes[(i + 1) % n]
+            node._links['list'] = links
+
+        return nodes
+
+    return build
+
+
+def run(n=1000000):
+    """
+    Measures and prints the bytes per node of both node classes, with 
+    their former dictionary layout and their current slotted one.
+    """
+    # Integers from 0 to n are allocated by both layouts alike, and a
+    # list holds MSCDLL nodes in both, so their cost cancels out.
+    rows = (
+        ('SSLL_Node (dict)', build_ssll_nodes(DictSSLLNode)),
+        ('SSLL_Node (slots)', build_ssll_nodes(SSLL_Node)),
+        ('MSCDLLNode (dict)', build_mscdll_nodes(DictMSCDLLNode, dict)),
+        ('MSCDLLNode (slots)', build_mscdll_nodes(MSCDLLNode, _MSCDLLLinks)),
+    )
+    results = {}
+
+    print(f'Bytes per node, {n} nodes'.center(50))
+    print('-' * 50)
+
+    for name, build in rows:
+        results[name] = bytes_per_node(build, n)
+        print(f'{name:<30}{results[name]:>20.1f}')
+
+    print('-' * 50)
+    return results
+
+
+if __name__ == '__main__':
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(n)
@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Appended, and not inserted first, so the standard library queue module
+# that multiprocessing imports is not shadowed by the project's queue.py.
+sys.path.append(os.path.join(HERE, '..', 'Queue'))
+
+from sharedQueue import SharedQueue
+
+PAYLOADS = (('small', 16), ('medium', 1024))
+
+
+def produce(queue, put, payload, items):
+    """
+    Puts items copies of the payload.
+    """
+    put = getattr(queue, put)
+
+    for _ in range(items):
+        put(payload)
+
+
+def consume(queue, get, items):
+    """
+    Gets items values, one at a time.
+    """
+    get = getattr(queue, get)
+
+    for _ in range(items):
+        get()
+
+
+def throughput(queue, put, get, payload, items, producers, consumers):
+    """
+    Runs the given amount of producer and consumer processes sharing the
+    queue, moving items copies of the payload from the first ones to the
+    second ones through its put and get methods, and returns the values
+    moved per second.
+    """
+    workers = [multiprocessing.Process(target=produce, args=(queue, put, payload, items // producers))
+               for _ in range(producers)]
+    workers += [multiprocessing.Process(target=consume, args=(queue, get, items // consumers))
+                for _ in range(consumers)]
+    start = time.perf_counter()
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return items / (time.perf_counter() - start)
+
+
+def run(items=100000, capacity=1000, shapes=((1, 1), (2, 2))):
+    """
+    Prints the values per second moved through multiprocessing.Queue and
+    SharedQueue, both holding at most capacity values, for each payload
+    size and each amount of producers and consumers in shapes. Starting
+    the processes is timed too, for both of them.
+    """
+    results = {}
+
+    print(f'Values per second, {items} values, capacity {capacity}'.center(70))
+    print('-' * 70)
+    print(f'{"payload":<25}{"multiprocessing":>15}{"SharedQueue":>15}{"ratio":>15}')
+    print('-' * 70)
+
+    for name, size in PAYLOADS:
+        payload = b'x' * size
+
+        for producers, consumers in shapes:
+            pipe_queue = multiprocessing.Queue(capacity)
+            baseline = throughput(pipe_queue, 'put', 'get', payload, items, producers, consumers)
+
+            with SharedQueue(capacity, slot_size=size) as shared_queue:
+                shared = throughput(shared_queue, 'enqueue', 'dequeue', payload, items,
+                                    producers, consumers)
+
+            results[name, producers, consumers] = (baseline, shared)
+            print(f'{f"{name} ({size} B), {producers}/{consumers}":<25}{baseline:>15.0f}'
+                  f'{shared:>15.0f}{shared / baseline:>14.2f}x')
+
+    print('-' * 70)
+    return results
+
+
+if __name__ == '__main__':
+
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run(items)
@@ -0,0 +1,334 @@
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+BATCH = 1000
+
+
+def load_class(folder, file_name, class_name):
+    """
+    Imports the module in folder/file_name.py and returns its class_name
+    class.
+
+    Stack, Queue and BPQueue import their own copies of their parents
+    from a 'modules' package in their folders, so any 'modules' package
+    imported before is dropped and the folder is put first in sys.path
+    while importing it. Modules are imported under a name of their own,
+    so Queue does not clash with the standard library queue.
+    """
+    path = os.path.join(HERE, '..', folder)
+
+    for name in [name for name in sys.modules if name.split('.')[0] == 'modules']:
+        del sys.modules[name]
+
+    sys.path.insert(0, path)
+
+    try:
+        spec = importlib.util.spec_from_file_location(f'benchmarked_{file_name}',
+                                                      os.path.join(path, file_name + '.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(path)
+
+    return getattr(module, class_name)
+
+
+def linear_batch(n):
+    """
+    Returns how many times to repeat an operation that walks the whole
+    structure, so each measure walks around 100.000 nodes.
+    """
+    return max(1, 10 ** 5 // n)
+
+
+def push_batch(method):
+    """
+    Calls method with BATCH different values and returns BATCH.
+    """
+    for i in range(BATCH):
+        method(i)
+
+    return BATCH
+
+
+def pop_batch(method, count, *args):
+    """
+    Calls method with args count times and returns count.
+    """
+    for _ in range(count):
+        method(*args)
+
+    return count
+
+
+def list_operations(list_class, push, pop):
+    """
+    Returns a dictionary mapping operation names to tuples of (setup,
+    action) functions for SortedSinglyLL and its children. setup(n)
+    builds what the action needs, out of the clock, and action(state, n)
+    runs the operation some amount of times and returns that amount.
+
+    push and pop are the names of the methods that add and remove nodes
+    at the end the structure works with. SortedSinglyLL pops from its 
+    tail, which walks the whole list, so it pops less nodes per measure.
+    Operations that remove nodes never remove more than n of them.
+    """
+    def build(n):
+        return list_class.from_iterable(range(n))
+
+    def inserts(ssll, n):
+        for i in range(10):
+            ssll.insert(i, n // 2)
+
+        return 10
+
+    def index_of(ssll, n):
+        value = n // 2
+
+        for _ in range(linear_batch(n)):
+            ssll.indexOf(value)
+
+        return linear_batch(n)
+
+    def split(ssll, n):
+        ssll.split(n // 2)
+        return 1
+
+    def clone(ssll, n):
+        for _ in range(linear_batch(n)):
+            ssll.clone()
+
+        return linear_batch(n)
+
+    def equal(lists, n):
+        one, two = lists
+
+        for _ in range(linear_batch(n)):
+            one == two
+
+        return linear_batch(n)
+
+    def iterate(ssll, n):
+        for _ in range(linear_batch(n)):
+            for _ in ssll:
+                pass
+
+        return linear_batch(n)
+
+    operations = {
+        push: (build, lambda ssll, n: push_batch(getattr(ssll, push))),
+        pop: (build, lambda ssll, n: pop_batch(getattr(ssll, pop), min(BATCH, n))),
+    }
+
+    if push == 'append':
+        operations['pop'] = (build, lambda ssll, n: pop_batch(ssll.pop, min(n, BATCH, linear_batch(n))))
+        operations['prepend'] = (build, lambda ssll, n: push_batch(ssll.prepend))
+        operations['pop(0)'] = (build, lambda ssll, n: pop_batch(ssll.pop, min(BATCH, n), 0))
+
+    operations.update({
+        'insert': (build, inserts),
+        'indexOf': (build, index_of),
+        'split': (build, split),
+        'clone': (build, clone),
+        '__eq__': (lambda n: (build(n), build(n)), equal),
+        'iteration': (build, iterate),
+    })
+    return operations
+
+
+def bpqueue_operations(bpqueue_class, levels=10):
+    """
+    Same as list_operations, for BPQueue. Values are spread evenly across
+    levels priority levels. BPQueue has no __eq__, and iterating it
+    dequeues its values, so each measure iterates it only once.
+    """
+    def build(n):
+        bpq = bpqueue_class(levels - 1)
+
+        for i in range(n):
+            bpq.enqueue(i, i % levels)
+
+        return bpq
+
+    def enqueues(bpq, n):
+        for i in range(BATCH):
+            bpq.enqueue(i, i % levels)
+
+        return BATCH
+
+    def index_of(bpq, n):
+        value = n - 1
+
+        for _ in range(linear_batch(n)):
+            bpq.indexOf(value)
+
+        return linear_batch(n)
+
+    def split(bpq, n):
+        bpq.split(levels // 2)
+        return 1
+
+    def clone(bpq, n):
+        for _ in range(linear_batch(n)):
+            bpq.clone()
+
+        return linear_batch(n)
+
+    def iterate(bpq, n):
+        for _ in bpq:
+            pass
+
+        return 1
+
+    return {
+        'enqueue': (build, enqueues),
+        'dequeue': (build, lambda bpq, n: pop_batch(bpq.dequeue, min(BATCH, n))),
+        'indexOf': (build, index_of),
+        'split': (build, split),
+        'clone': (build, clone),
+        'iteration': (build, iterate),
+    }
+
+
+def structures():
+    """
+    Returns a dictionary mapping each structure name to its operations.
+    """
+    return {
+        'SortedSinglyLL': list_operations(
+            load_class('SortedSinglyLinkedList', 'sortedSinglyLL', 'SortedSinglyLL'), 'append', 'pop'),
+        'Stack': list_operations(load_class('Stack', 'stack', 'Stack'), 'push', 'pop'),
+        'Queue': list_operations(load_class('Queue', 'queue', 'Queue'), 'enqueue', 'dequeue'),
+        'BPQueue': bpqueue_operations(load_class('BoundedPriorityQueue', 'bpqueue', 'BPQueue')),
+    }
+
+
+def measure(setup, action, n):
+    """
+    Returns the best seconds per operation out of a few runs of action,
+    calling setup before each one. Big structures are run only once.
+    """
+    best = float('inf')
+
+    for _ in range(max(1, min(5, 10 ** 5 // n))):
+        state = setup(n)
+        start = time.perf_counter()
+        count = action(state, n)
+        best = min(best, (time.perf_counter() - start) / count)
+
+    return best
+
+
+def run(sizes=SIZES, names=None):
+    """
+    Times every operation of every structure (or of the ones whose names
+    are passed) for each size, printing a table per structure, and returns
+    the results as a dictionary of {structure: {operation: {size:
+    seconds per operation}}}.
+    """
+    results = {}
+
+    for name, operations in structures().items():
+        if names and name not in names:
+            continue
+
+        results[name] = {}
+        print(f'{name}, seconds per operation'.center(20 + 12 * len(sizes)))
+        print('-' * (20 + 12 * len(sizes)))
+        print(f'{"operation":<20}' + ''.join([f'{size:>12}' for size in sizes]))
+        print('-' * (20 + 12 * len(sizes)))
+
+        for operation, (setup, action) in operations.items():
+            timings = {str(size): measure(setup, action, size) for size in sizes}
+            results[name][operation] = timings
+            print(f'{operation:<20}' + ''.join([f'{timing:>12.3g}' for timing in timings.values()]))
+
+        print('-' * (20 + 12 * len(sizes)), '\n')
+
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """
+    Returns a list of (structure, operation, size, ratio) tuples for each
+    timing that is slower than the baseline one by more than tolerance
+    (0.25 means 25% slower). Timings missing in either one are skipped.
+    """
+    found = []
+
+    for name, operations in results.items():
+        for operation, timings in operations.items():
+            for size, timing in timings.items():
+                before = baseline.get(name, {}).get(operation, {}).get(size)
+
+                if before and timing / before > 1 + tolerance:
+                    found.append((name, operation, size, timing / before))
+
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Times the SortedSinglyLL family operations and compares them to a baseline.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help='structure sizes to time (default: 10^2 to 10^6)')
+    parser.add_argument('--structures', nargs='+',
+                        help='only time these structures (default: all of them)')
+    parser.add_argument('--output', default=os.path.join(HERE, 'results.json'),
+                        help='JSON file to write the results to')
+    parser.add_argument('--baseline', default=os.path.join(HERE, 'baseline.json'),
+                        help='JSON file with the results to compare against')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline file too')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='how much slower than the baseline is a regression (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    if min(args.sizes) < 2:
+        parser.error('sizes must be at least 2, so the structures can be split')
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': run(args.sizes, args.structures),
+    }
+
+    with open(args.output, 'w') as fp:
+        json.dump(report, fp, indent=2)
+
+    print('Results written to', args.output)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as fp:
+            json.dump(report, fp, indent=2)
+
+        print('Baseline written to', args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('No baseline to compare against. Run with --save-baseline to store one.')
+        return 0
+
+    with open(args.baseline) as fp:
+        found = regressions(report['results'], json.load(fp)['results'], args.tolerance)
+
+    for name, operation, size, ratio in found:
+        print(f'REGRESSION: {name}.{operation} with {size} values is {ratio:.2f}x slower.')
+
+    if not found:
+        print('No regressions against', args.baseline)
+
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
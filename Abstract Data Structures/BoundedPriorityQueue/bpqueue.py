@@ -1,5 +1,7 @@
+import collections
+
 from modules.array import Array
-from modules.queue import Queue
+from modules.queue import Queue, _wait_in_line, _wakeup_next
 
 class BPQueue():
     """
@@ -26,6 +28,12 @@ class BPQueue():
     debugging (in detail) and for visualizing the queue as a whole in a 
     comfortable way.
 
+    A bitmap of the priority levels that have nodes is kept up to date as 
+    nodes are enqueued and dequeued, so dequeue() and peek() find the highest 
+    non-empty level with a few bit operations, instead of checking the queues 
+    one by one from level 0. This keeps them fast even with many levels and 
+    only a few of them in use.
+
     Methods:
         __init__
         __contains__
@@ -52,10 +60,14 @@ class BPQueue():
     Helper methods:
         _is_valid_priority_level : Helper method to validate that the priority 
             level is in range.
+        _index_levels : Helper method to rebuild the bitmap of non-empty 
+            priority levels.
 
     Inner classes:
         _BPQueueIterator : Generates and return a BPQueue iterator object when 
             __iter__ is called.
+        _LevelBitmap : Keeps track of which priority levels have nodes, to find
+            the highest non-empty one without checking each of them.
 
     Author: Renzo Nahuel Murina Cadierno
     Contact: nmcadierno@hotmail.com
@@ -74,6 +86,7 @@ class BPQueue():
             'Minimum priority level must be an integer value.'
 
         self._priority_arr = Array([Queue() for i in range(min_priority_level + 1)])
+        self._levels = self._LevelBitmap(min_priority_level + 1)
         self._length = 0
 
     def __contains__(self, value):
@@ -92,7 +105,7 @@ class BPQueue():
         return False
 
     def __iter__(self):
-        return self._BPQueueIterator(self._priority_arr)
+        return self._BPQueueIterator(self)
 
 
     def __len__(self):
@@ -117,20 +130,15 @@ class BPQueue():
         same length as self, its same priority levels and node clones in them, 
         linked together in the same fashion as self.
         """
-
-        new_bpq = BPQueue(len(self._priority_arr))
-        new_bpq._priority_arr = Array([Queue() for _ in range(len(self._priority_arr))])
+        new_bpq = BPQueue(self.get_lowest_priority_lvl())
 
         for i, queue in enumerate(self._priority_arr):
 
             if not queue.is_empty():
-                current = queue._head
-
-                while current:
-                    new_bpq._priority_arr[i].enqueue(current.value)
-                    new_bpq._length += 1
-                    current = current._next
+                new_bpq._priority_arr[i] = queue.clone()
 
+        new_bpq._levels = self._levels.clone()
+        new_bpq._length = self._length
         return new_bpq
 
     def dequeue(self, priority_level=None):
@@ -148,22 +156,21 @@ class BPQueue():
                 or the Queue in the specified priority level (if any) are empty.
         """
         if not priority_level:
-
-            for queue in self._priority_arr:
-
-                if not queue.is_empty():
-                    self._length -= 1
-                    return queue.dequeue()
-        
+            priority_level = self._levels.first()
         else:
             self._is_valid_priority_level(priority_level)
-            queue = self._priority_arr[priority_level]
 
-            if not queue.is_empty():
-                self._length -= 1
-                return queue.dequeue()
+        if priority_level < 0 or self._priority_arr[priority_level].is_empty():
+            raise AssertionError('Cannot dequeue from an empty queue.')
 
-        raise AssertionError('Cannot dequeue from an empty queue.')
+        queue = self._priority_arr[priority_level]
+        node = queue.dequeue()
+        self._length -= 1
+
+        if queue.is_empty():
+            self._levels.discard(priority_level)
+
+        return node
 
     def dprint(self):
         """
@@ -192,11 +199,11 @@ class BPQueue():
             current = queue._head
 
             while current:
-                string += f'\n> BPQ idx: {bpq_idx}, In-PQ idx: {current._idx}, Value: {str(current.value)}'
+                string += f'\n> BPQ idx: {bpq_idx}, In-PQ idx: {queue._index_of_node(current)}, Value: {str(current.value)}'
                 bpq_idx += 1
 
                 if not current._next:
-                    nodes_per_level.append(current._idx)
+                    nodes_per_level.append(queue._index_of_node(current))
 
                 current = current._next
                 
@@ -245,6 +252,7 @@ class BPQueue():
 
         self._is_valid_priority_level(priority_level)
         self._priority_arr[priority_level].enqueue(node_or_value)
+        self._levels.add(priority_level)
         self._length += 1
 
     def indexOf(self, value, **kwargs):
@@ -286,9 +294,9 @@ class BPQueue():
                     if current.value == value:
 
                         if lazy:
-                            return (i, current._idx)
+                            return (i, queue._index_of_node(current))
 
-                        indexes.append((i, current._idx))
+                        indexes.append((i, queue._index_of_node(current)))
 
                     current = current._next
 
@@ -335,20 +343,15 @@ class BPQueue():
                 are empty.
         """
         if not priority_level:
+            priority_level = self._levels.first()
 
-            for queue in self._priority_arr:
-
-                if not queue.is_empty():
-                    return queue.peek()
+            if priority_level < 0:
+                return None
 
         else:
             self._is_valid_priority_level(priority_level)
-            queue = self._priority_arr[priority_level]
 
-            if not queue.is_empty():
-                return queue.peek()
-
-        return None
+        return self._priority_arr[priority_level].peek()
 
     def pprint(self, horizontal=False):
         """
@@ -447,6 +450,8 @@ class BPQueue():
                 current_node = current_node._next
 
         self._priority_arr = current_bpq
+        self._index_levels()
+        new_bpq._index_levels()
         return new_bpq
 
     def _is_valid_priority_level(self, priority_level):
@@ -458,24 +463,316 @@ class BPQueue():
         
         return True
 
+    def _index_levels(self):
+        """
+        Helper method to rebuild the bitmap of non-empty priority levels from
+        the queues in self._priority_arr, after they are replaced as a whole.
+        """
+        self._levels = self._LevelBitmap(len(self._priority_arr))
+
+        for i, queue in enumerate(self._priority_arr):
+
+            if not queue.is_empty():
+                self._levels.add(i)
+
     class _BPQueueIterator:
         """
         Inner class to generate and return a BPQueue iterator object when
-        __iter__ is called.
+        __iter__ is called. It dequeues through the BPQueue, so its length
+        and its bitmap of non-empty levels stay up to date.
         """
-        def __init__(self, priority_arr):
-            self._priority_arr = priority_arr
+        def __init__(self, bpq):
+            self._bpq = bpq
 
         def __iter__(self):
             return self
 
         def __next__(self):
-            for queue in self._priority_arr:
+            if not self._bpq._length:
+                raise StopIteration
+
+            return self._bpq.dequeue()
+
+    class _LevelBitmap:
+        """
+        Inner class that keeps track of which priority levels have nodes, as
+        a hierarchy of bitmaps stored in 64-bit words.
+
+        The bottom layer has one bit per level, set while its queue has nodes.
+        Each layer above has one bit per word of the layer below, set while 
+        that word is not zero, up to a top layer of a single word. To find the
+        highest non-empty level, the lowest set bit of a word is isolated with
+        (word & -word) from the top layer down, which takes one step per layer:
+        one for up to 64 levels, two for up to 4096, three for up to 262144.
+        Setting or clearing a bit only goes up while a word changes between
+        zero and non-zero.
+        """
+        def __init__(self, size):
+            self._layers = []
+
+            while True:
+                size = (size + 63) >> 6
+                self._layers.append([0] * max(size, 1))
+
+                if size <= 1:
+                    break
+
+        def add(self, level):
+            for layer in self._layers:
+                word = layer[level >> 6]
+                layer[level >> 6] = word | (1 << (level & 63))
+
+                if word:
+                    break
+
+                level >>= 6
+
+        def discard(self, level):
+            for layer in self._layers:
+                word = layer[level >> 6] & ~(1 << (level & 63))
+                layer[level >> 6] = word
+
+                if word:
+                    break
+
+                level >>= 6
+
+        def first(self):
+            """
+            Returns the highest non-empty priority level, or -1 if all of them
+            are empty.
+            """
+            if not self._layers[-1][0]:
+                return -1
+
+            level = 0
+
+            for layer in reversed(self._layers):
+                word = layer[level]
+                level = (level << 6) | ((word & -word).bit_length() - 1)
+
+            return level
+
+        def clone(self):
+            new_bitmap = object.__new__(self.__class__)
+            new_bitmap._layers = [layer[:] for layer in self._layers]
+            return new_bitmap
+
+
+class AsyncBPQueue(BPQueue):
+    """
+    A BPQueue for coroutines running on the same asyncio event loop:
+    producers await put() and consumers await get(), and each of them is
+    suspended while the BPQueue is full or empty, letting the loop run
+    other coroutines, instead of polling peek() in a loop.
+
+    Wakeups are priority-aware. Consumers can wait for a value of any
+    priority level, or of one level in particular, and each level keeps
+    its own line of waiting coroutines, plus one line for the ones that
+    take any level. Putting a value wakes up the oldest coroutine waiting
+    for its level, or the oldest one waiting for any level if there is
+    none. So, a consumer waiting for level 3 is not woken up by values
+    put in level 5, and it does not take values meant for others: one
+    waiting for any level that is woken up by a value takes that value,
+    and not one of a higher priority put after it for someone else.
+
+    If maxsize is greater than 0, the BPQueue holds at most that many 
+    nodes across all of its levels, and put() waits while it is full. 
+    Cancelling a waiting coroutine is safe: it leaves its line, and if it
+    had been woken up already, it passes its turn to the next one in it.
+
+    Coroutines of other event loops or threads must not share the BPQueue.
+
+    Attributes:
+        self._maxsize : Most nodes the BPQueue can hold, or 0 for no limit.
+        self._getters : Dictionary mapping each priority level, or None
+                        for any level, to a deque of futures of the 
+                        coroutines waiting in get() for it.
+        self._putters : Deque of futures of the coroutines waiting in put().
+
+    Methods:
+        __init__
+        get_maxsize : Returns the most nodes the BPQueue can hold.
+        is_full : Returns True if the BPQueue holds maxsize nodes.
+        put : Coroutine that enqueues a value/node to a priority level,
+              waiting for room if the BPQueue is full.
+        put_nowait : Same as put(), without waiting.
+        get : Coroutine that dequeues the next node from the BPQueue or
+              from one of its levels, waiting for one if it is empty.
+        get_nowait : Same as get(), without waiting.
+        enqueue : Same as put_nowait().
+        dequeue : Same as get_nowait(), so iterating the BPQueue wakes up
+                  the coroutines waiting in put() too.
+        clone : Overrides super().clone() so that an AsyncBPQueue with the
+                same maxsize is returned.
+        split : Overrides super().split() so that the second half is an
+                AsyncBPQueue with the same maxsize.
+
+    Helper methods:
+        _has_values : Returns True if there is a node to get from the
+                      BPQueue or from one of its levels.
+        _wakeup_getter : Wakes up the coroutine next in line for a value
+                         put in a priority level.
+        _adopt : Moves the priority levels of a BPQueue into a new
+                 instance of this class.
+    """
+
+    def __init__(self, min_priority_level, maxsize=0):
+        """
+        Creates a BPQueue with priority levels from 0 to min_priority_level
+        as BPQueue does, which can hold at most maxsize nodes if it is 
+        greater than 0.
+        """
+        assert type(maxsize) is int and maxsize >= 0, \
+            'Maxsize must be an integer equal to or greater than 0.'
+
+        super().__init__(min_priority_level)
+        self._maxsize = maxsize
+        self._getters = {}
+        self._putters = collections.deque()
+
+    def get_maxsize(self):
+        """
+        Returns the most nodes the BPQueue can hold, or 0 if there is no
+        limit.
+        """
+        return self._maxsize
 
-                if not queue.is_empty():
-                    return queue.dequeue()
+    def is_full(self):
+        """
+        Returns True if the BPQueue has a maxsize and holds that many nodes.
+        """
+        return bool(self._maxsize) and self._length >= self._maxsize
+
+    async def put(self, node_or_value, priority_level=None):
+        """
+        Enqueues a node to the Queue associated with the priority level 
+        passed as parameter, as enqueue() does, waiting until another
+        coroutine gets a node from the BPQueue if it is full.
+        """
+        while self.is_full():
+            await _wait_in_line(self._putters)
+
+        self.put_nowait(node_or_value, priority_level)
+
+    def put_nowait(self, node_or_value, priority_level=None):
+        """
+        Enqueues a node to the Queue associated with the priority level 
+        passed as parameter, as enqueue() does, and wakes up the coroutine
+        next in line for a value of that level, if any. An OverflowError is
+        raised if the BPQueue is full.
+        """
+        if self.is_full():
+            raise OverflowError('Queue is full.')
+
+        if not priority_level and priority_level != 0:
+            priority_level = self.get_lowest_priority_lvl()
+
+        super().enqueue(node_or_value, priority_level)
+        self._wakeup_getter(priority_level)
+
+    async def get(self, priority_level=None):
+        """
+        Dequeues the node from the queue associated to the priority level
+        passed as parameter or, if no priority level is passed, the next 
+        node of the BPQueue, as dequeue() does. If there is none, it waits
+        until another coroutine puts one. When waiting for any level, the 
+        node put in the level it was woken up for is dequeued, if it is 
+        still there, since a higher priority one may have woken up another
+        coroutine waiting for its level.
+        """
+        if priority_level is not None:
+            self._is_valid_priority_level(priority_level)
+
+        woken_for = None
+
+        while not self._has_values(priority_level):
+            waiters = self._getters.setdefault(priority_level, collections.deque())
+            woken_for = await _wait_in_line(waiters, self._wakeup_getter)
+
+        if priority_level is None and woken_for is not None and self._has_values(woken_for):
+            priority_level = woken_for
+
+        return self.get_nowait(priority_level)
+
+    def get_nowait(self, priority_level=None):
+        """
+        Same as get(), without waiting. An IndexError is raised if there 
+        is no node to get. The oldest coroutine waiting in put() is woken
+        up, if any.
+        """
+        if not self._has_values(priority_level):
+            raise IndexError('Queue is empty.')
+
+        node = super().dequeue(priority_level)
+        _wakeup_next(self._putters)
+        return node
+
+    def enqueue(self, node_or_value, priority_level=None):
+        """
+        Same as put_nowait().
+        """
+        self.put_nowait(node_or_value, priority_level)
+
+    def dequeue(self, priority_level=None):
+        """
+        Same as get_nowait().
+        """
+        return self.get_nowait(priority_level)
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the BPQueue, as an 
+        AsyncBPQueue with the same maxsize.
+        """
+        return self._adopt(super().clone())
+
+    def split(self, priority_level: int):
+        """
+        Splits the BPQueue in two by a priority level as BPQueue.split()
+        does. The second half is an AsyncBPQueue with the same maxsize, and
+        the coroutines waiting in put() are woken up.
+        """
+        second_half = self._adopt(super().split(priority_level))
+
+        while _wakeup_next(self._putters):
+            pass
 
-            raise StopIteration
+        return second_half
+
+    def _has_values(self, priority_level):
+        """
+        Helper method that returns True if the queue of the priority level
+        passed as parameter, or the BPQueue if it is None, has nodes.
+        """
+        if priority_level is None:
+            return self._length > 0
+
+        return not self._priority_arr[priority_level].is_empty()
+
+    def _wakeup_getter(self, priority_level):
+        """
+        Helper method that wakes up the oldest coroutine waiting for a 
+        value of the priority level passed as parameter or, if there is
+        none, the oldest one waiting for a value of any level, telling it
+        which level the value is in.
+        """
+        if _wakeup_next(self._getters.get(priority_level, ()), priority_level):
+            return
+
+        _wakeup_next(self._getters.get(None, ()), priority_level)
+
+    def _adopt(self, bpq):
+        """
+        Helper method that returns a new instance of this class with the 
+        same maxsize, holding the priority levels and nodes of the BPQueue
+        passed as parameter, which must not be used afterwards.
+        """
+        new_bpq = self.__class__(0, maxsize=self._maxsize)
+        new_bpq._priority_arr = bpq._priority_arr
+        new_bpq._levels = bpq._levels
+        new_bpq._length = bpq._length
+        return new_bpq
 
 
 if __name__ == '__main__':
@@ -636,3 +933,16 @@ if __name__ == '__main__':
 # bpq.pprint(True)                                          #
 # print('-' * 80, '\nSplitted queue:\n')                    # 
 # second_half.pprint(True)                                  # /split
+
+
+# import asyncio                                            # AsyncBPQueue
+# async def main():                                         #
+#     abpq = AsyncBPQueue(7, maxsize=10)                    #
+#     urgent = asyncio.create_task(abpq.get(0))             #
+#     anything = asyncio.create_task(abpq.get())            #
+#     await asyncio.sleep(0)                                #
+#     abpq.put_nowait('Not urgent', 5)                      #
+#     abpq.put_nowait('Urgent!', 0)                         #
+#     print(await urgent, '|', await anything)              #
+#     print(len(abpq))                                      #
+# asyncio.run(main())                                       # /AsyncBPQueue
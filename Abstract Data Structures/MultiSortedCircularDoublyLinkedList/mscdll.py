@@ -235,7 +235,7 @@ class MSCDLL:
         for node in self:
 
             # create a key for the new list name
-            node._links[name] = {}
+            node._links[name] = _MSCDLLLinks()
 
             # set its value to the next and back fields of the original name
             for key, value in node._links[self._id].items():
@@ -900,7 +900,7 @@ class MSCDLL:
                         continue
                     
                     # create the links to the original list on each node in the extension list
-                    node._links[self._id] = {}
+                    node._links[self._id] = _MSCDLLLinks()
                     node.set_next(self, node.get_next(mscdll))
                     node.set_back(self, node.get_back(mscdll))
                     
@@ -980,7 +980,7 @@ class MSCDLL:
         # Also, if we are to unlink all nodes from mscdll, we remove the references
         # to that list from all of its nodes.
         while current is not mscdll_last:
-            current._links[self._id] = {}
+            current._links[self._id] = _MSCDLLLinks()
             current.set_next(self, current.get_next(mscdll))
             current.set_back(self, current.get_back(mscdll))
             next_node = current.get_next(mscdll)
@@ -1326,11 +1326,11 @@ class MSCDLL:
                 _links' keys.
         """
         if isinstance(node_or_value, MSCDLLNode):
-            node_or_value._links[self._id] = {}
+            node_or_value._links[self._id] = _MSCDLLLinks()
             return node_or_value
 
         node_or_value = MSCDLLNode(node_or_value)
-        node_or_value._links[self._id] = {}
+        node_or_value._links[self._id] = _MSCDLLLinks()
         return node_or_value
 
     def get_observer(self):
@@ -1751,10 +1751,49 @@ class _MSCDLLReverseIterator:
         return node
 
 
+class _MSCDLLLinks:
+    """
+    A class to hold a node's 'next' and 'back' references in one MSCDLL instance.
+
+    It replaces the dictionary each node used to keep per list with two slots, 
+    while still supporting the dictionary operations the MSCDLL methods use on 
+    it: getting and setting 'next' and 'back' by key, and items(). Just like a 
+    dictionary, a reference that has not been set yet is not there at all.
+    """
+    __slots__ = ('back', 'next')
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, node):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, node)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def items(self):
+        """
+        Returns a list of (key, node) tuples for each reference that is set.
+        """
+        return [(key, getattr(self, key)) for key in self.__slots__ if hasattr(self, key)]
+
+
 class MSCDLLNode:
     """
     A class to create valid MSCDLL nodes, which are to be added to MSCDLL instances.
 
+    Nodes use __slots__ instead of an instance dictionary, and their per-list 
+    links are _MSCDLLLinks instances instead of dictionaries, which keeps the 
+    memory taken by each node low when lists hold lots of them.
+
     Attributes:
         value               _links              _id
     
@@ -1764,6 +1803,7 @@ class MSCDLLNode:
         get_back            set_name            set_next
         set_back            set_MSCDLL_links    pprint
     """
+    __slots__ = ('value', '_links', '_id')
 
     def __init__(self, value, **kwargs):
         """
@@ -1861,7 +1901,7 @@ class MSCDLLNode:
         dictionary and assigns an empty dictionary as its value.
         """
         if isinstance(mscdll, MSCDLL):
-            self._links[mscdll._id] = {}
+            self._links[mscdll._id] = _MSCDLLLinks()
             return
         
         raise TypeError(
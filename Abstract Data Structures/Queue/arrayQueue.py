@@ -0,0 +1,352 @@
+from modules.array import Array
+from modules.sortedSinglyLL import SSLL_Node
+
+class ArrayQueue:
+    """
+    A Queue that stores its values in a circular buffer: an Array (the
+    ctypes one in the modules folder) with a front cursor and a length,
+    instead of one linked node per value.
+
+    Values are enqueued in the slot after the last one, and dequeued from
+    the slot the front points at, which then moves one slot forward. Both
+    cursors wrap around at the end of the Array, so neither enqueuing nor
+    dequeuing moves any other value, and the values lie next to each other
+    in memory.
+
+    When the Array is full, the values are moved to a new one twice as big,
+    so enqueuing runs in amortized constant time. When only a quarter of it
+    is used, they are moved to one half as big, never going under its
+    starting capacity, so a queue that drained does not keep its peak
+    memory. Since any value is one slot away from the front, peek() can
+    look at any depth in constant time.
+
+    It has the same API as Queue: enqueue, dequeue, their _many versions,
+    peek, clone, split and clear work the same, iteration goes from the top
+    to the end of the queue, and it prints out the same way. Since there are
+    no nodes, nodes enqueued are stored by their value, and dequeue() and
+    peek() return new, unlinked SSLL_Nodes holding the value.
+
+    Attributes:
+        self._values : Array holding the values.
+        self._capacity : Amount of slots in the Array.
+        self._min_capacity : Capacity the Array never shrinks under.
+        self._front : Slot holding the value at the top of the queue.
+        self._length : Amount of values in the queue.
+
+    Methods:
+        __init__
+        __len__
+        __str__
+        __iter__ : Generator that yields each value from the top to the
+                   end of the queue.
+        __getitem__ : Gets the value at an index, counting from the top.
+        __eq__
+        get_capacity : Returns the amount of slots in the Array.
+        is_empty : Returns True if the queue has no values.
+        clear : Removes all values from the queue.
+        clone : Creates and returns a shallow copy of the queue.
+        peek : Returns a node holding the value at the top of the queue,
+               or at any depth.
+        dequeue : Removes the value at the top of the queue and returns a
+                  node holding it.
+        dequeue_many : Removes a number of values from the top of the queue
+                       and returns nodes holding them.
+        enqueue : Adds a value/node at the end of the queue.
+        enqueue_many : Adds all values/nodes in an iterable at the end of
+                       the queue.
+        split : Splits the queue in two starting at the given index.
+        _resize : Moves the values to a new Array of a given capacity.
+        _slot : Returns the slot of an index counting from the top.
+    """
+
+    def __init__(self, *args, capacity=8):
+        """
+        Creates an Array with room for capacity values, or for the values
+        passed as args if there are more of them, and enqueues the args in
+        that order. So, as in Queue, the first one ends up at the top.
+        """
+        assert type(capacity) is int and capacity > 0, \
+            'Capacity must be an integer greater than 0.'
+
+        self._min_capacity = capacity
+        self._capacity = max(capacity, len(args))
+        self._values = Array(self._capacity)
+        self._front = 0
+        self._length = 0
+
+        for arg in args:
+            self.enqueue(arg)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return "<TOP> " + ' <- '.join([str(value) for value in self]) + ' <END>'
+
+    def __iter__(self):
+        values = self._values._values
+
+        for i in range(self._length):
+            yield values[self._slot(i)]
+
+    def __getitem__(self, idx):
+        if type(idx) is int and idx < 0:
+            idx += self._length
+
+        if type(idx) is not int or not 0 <= idx < self._length:
+            raise IndexError('Index out of range.')
+
+        return self._values._values[self._slot(idx)]
+
+    def __eq__(self, other):
+        """
+        Returns True if both queues hold values with the same repr in the
+        same order. other can be any iterable queue, like a Queue.
+        """
+        if len(self) != len(other):
+            return False
+
+        for one, two in zip(self, other):
+            if repr(one) != repr(two):
+                return False
+
+        return True
+
+    def get_capacity(self):
+        """
+        Returns the amount of slots in the Array, this is, how many values
+        the queue can hold before growing.
+        """
+        return self._capacity
+
+    def is_empty(self):
+        """
+        Returns True if the queue has no values.
+        """
+        return self._length == 0
+
+    def clear(self):
+        """
+        Removes all values from the queue, replacing the Array with one of
+        the starting capacity.
+        """
+        self._capacity = self._min_capacity
+        self._values = Array(self._capacity)
+        self._front = 0
+        self._length = 0
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the queue, with the same
+        starting capacity.
+        """
+        return ArrayQueue(*self, capacity=self._min_capacity)
+
+    def peek(self, depth=0):
+        """
+        Returns a new SSLL_Node holding the value at the top of the queue,
+        or None if the queue is empty.
+
+        If depth is passed, the value that many positions behind the top
+        is held instead, which takes constant time at any depth.
+        """
+        if not 0 <= depth < self._length:
+            return None
+
+        return SSLL_Node(self._values._values[self._slot(depth)])
+
+    def dequeue(self):
+        """
+        Removes the value at the top of the queue and returns a new
+        SSLL_Node holding it. The Array shrinks by half if only a quarter
+        of it is used afterwards.
+        """
+        assert self._length, 'Queue is empty.'
+
+        values = self._values._values
+        value = values[self._front]
+        values[self._front] = None
+        self._front = (self._front + 1) % self._capacity
+        self._length -= 1
+
+        if self._length <= self._capacity // 4 and self._capacity // 2 >= self._min_capacity:
+            self._resize(self._capacity // 2)
+
+        return SSLL_Node(value)
+
+    def dequeue_many(self, count=None, lazy=False):
+        """
+        Removes count values from the top of the queue (all of them if
+        count is None or greater than the queue length) and returns new
+        SSLL_Nodes holding them, in the order they were enqueued, in a list.
+        If lazy=True, a generator that yields them is returned instead.
+
+        The Array is resized at most once, after all of them are removed.
+        An empty queue, or a count of 0, returns no values.
+        """
+        if not self._length or count == 0:
+            return iter(()) if lazy else []
+
+        if count is None:
+            count = self._length
+
+        assert type(count) is int and count > 0, \
+            'Count must be an integer greater than 0.'
+
+        count = min(count, self._length)
+
+        values = self._values._values
+        nodes = []
+
+        for _ in range(count):
+            nodes.append(SSLL_Node(values[self._front]))
+            values[self._front] = None
+            self._front = (self._front + 1) % self._capacity
+
+        self._length -= count
+        capacity = self._capacity
+
+        while self._length <= capacity // 4 and capacity // 2 >= self._min_capacity:
+            capacity //= 2
+
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+        return iter(nodes) if lazy else nodes
+
+    def enqueue(self, node_or_value):
+        """
+        Pushes the value, or the value of the node, passed as parameter to
+        the end of the queue. If the Array is full, the values are moved to
+        one twice as big first.
+        """
+        if self._length == self._capacity:
+            self._resize(self._capacity * 2)
+
+        value = node_or_value.value if isinstance(node_or_value, SSLL_Node) else node_or_value
+        self._values._values[(self._front + self._length) % self._capacity] = value
+        self._length += 1
+
+    def enqueue_many(self, iterable):
+        """
+        Pushes all values or nodes in the iterable passed as parameter to
+        the end of the queue, in that order. The Array is resized at most
+        once, before any of them is stored.
+        """
+        items = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        capacity = self._capacity
+
+        while self._length + len(items) > capacity:
+            capacity *= 2
+
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+        values = self._values._values
+
+        for item in items:
+            value = item.value if isinstance(item, SSLL_Node) else item
+            values[(self._front + self._length) % self._capacity] = value
+            self._length += 1
+
+    def split(self, idx):
+        """
+        Splits the queue into two, where the second half starts with the
+        index passed as a parameter. That is, the values from that index
+        onwards are moved to a new queue with the same starting capacity,
+        which is returned.
+
+        A valid split can only occur from index 1 onwards.
+        """
+        assert self._length, 'Queue is empty.'
+        assert idx != 0, \
+            "Cannot split from the top, it must be from the second value onwards."
+
+        if type(idx) is not int or not 0 < idx < self._length:
+            raise IndexError('Index out of range.')
+
+        values = self._values._values
+        second_half = ArrayQueue(capacity=self._min_capacity)
+        second_half.enqueue_many([values[self._slot(i)] for i in range(idx, self._length)])
+
+        for i in range(idx, self._length):
+            values[self._slot(i)] = None
+
+        self._length = idx
+        capacity = self._capacity
+
+        while self._length <= capacity // 4 and capacity // 2 >= self._min_capacity:
+            capacity //= 2
+
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+        return second_half
+
+    def _resize(self, capacity):
+        """
+        Moves the values to a new Array with the capacity passed as
+        parameter, the top one going to its first slot. They are copied
+        with at most two slice assignments: from the front to the end of
+        the old Array, and from its start, if the values wrapped around.
+        """
+        old_values = self._values._values
+        new_array = Array(capacity)
+        new_values = new_array._values
+        until_end = min(self._length, self._capacity - self._front)
+
+        new_values[:until_end] = old_values[self._front:self._front + until_end]
+
+        if until_end < self._length:
+            new_values[until_end:self._length] = old_values[:self._length - until_end]
+
+        self._values = new_array
+        self._capacity = capacity
+        self._front = 0
+
+    def _slot(self, idx):
+        """
+        Returns the slot holding the value at the index passed as
+        parameter, counting from the top of the queue.
+        """
+        return (self._front + idx) % self._capacity
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    aq = ArrayQueue(True, 1, None, [1,2], {"a":3}, [])
+
+    print(aq)                                   # __str__
+
+    # aq.enqueue("asd")                           # enqueue
+    # print(aq, aq.get_capacity())                # /enqueue
+
+    # print(aq.dequeue())                         # dequeue
+    # print(aq)                                   # /dequeue
+
+    # print(aq.peek(), aq.peek(3), aq[-1])        # peek
+
+    # aq.enqueue_many(range(20))                  # enqueue_many
+    # print(aq, aq.get_capacity())                # /enqueue_many
+
+    # print(aq.dequeue_many(22))                  # dequeue_many
+    # print(aq, aq.get_capacity())                # /dequeue_many
+
+    # half_queue = aq.split(3)                    # split
+    # print(aq)                                   #
+    # print(half_queue)                           # /split
+
+    # clone = aq.clone()                          # clone
+    # clone.dequeue()                             #
+    # print(aq)                                   #
+    # print(clone)                                # /clone
+
+    # aq.clear()                                  # clear
+    # print(aq, aq.get_capacity())                # /clear
@@ -1,3 +1,7 @@
+import asyncio
+import collections
+import threading
+
 from modules.sortedSinglyLL import SortedSinglyLL, SSLL_Node
 
 class Queue(SortedSinglyLL):
@@ -18,13 +22,17 @@ class Queue(SortedSinglyLL):
         peek : Returns a reference to the top of the queue.
         dequeue : Removes the node from the top of the queue and returns
                   a reference to it.
+        dequeue_many : Removes a number of nodes from the top of the
+                       queue in one step and returns them.
         enqueue : Adds a node at the end of the queue.
+        enqueue_many : Adds all values/nodes in an iterable at the end of
+                       the queue in one step.
         split : Overrides super().split() so that both halves can be
                 returned as queue instances.
     """
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
     def clear(self):                                                   
         """
@@ -37,17 +45,16 @@ class Queue(SortedSinglyLL):
         """ 
         Clones the Queue and returns an a reference to the new one.
 
-        _queue_instance is a private variable used by self.split().
-        Do not assign a value to it unless you are trying to clone 
-        another queue using this instance's method, in which case, 
-        it is more practical to use that other queue's own split().
+        _queue_instance is a private variable to clone the nodes of another
+        queue using this instance's method. Do not assign a value to it,
+        it is more practical to use that other queue's own clone().
 
         This method is intended to override super().clone(), as that
         class clone() returns the second half of the list as an
         instance of itself, and not of its children's (we need a
         Queue to be returned, not a SortedSinglyLL).
         """
-        clone = Queue()
+        clone = Queue(**self._options())
         current = _queue_instance._head if _queue_instance else self._head
         
         while current:
@@ -66,17 +73,53 @@ class Queue(SortedSinglyLL):
     def dequeue(self):                                      
         """
         Removes the top element from the queue and returns a reference to it.
+
+        The top is the head of the list, which is unlinked in constant time
+        by moving the list base one step forward, without looking it up by
+        index nor reindexing the rest of the queue. The index of each node
+        is only worked out from the base when it is asked for, as dprint()
+        or indexOf() do.
         """
-        return super().pop(0)    
+        return self._unlink_head()
 
     def enqueue(self, node_or_value):                         
         """
         Pushes the object passed as a parameter to the end of the queue.
 
         If the object is not a valid node instance, it is converted to one.
+        It is linked to the tail and takes the next stored index, so it runs
+        in constant time.
+        """
+        self.append(node_or_value)
+
+    def dequeue_many(self, count=None, lazy=False):
+        """
+        Removes count elements from the top of the queue (all of them if
+        count is None or greater than the queue length) and returns them,
+        in the order they were enqueued, in a list. If lazy=True, a 
+        generator that yields them is returned instead.
+
+        The elements are unlinked from the queue as a single chain, moving
+        the list base once, instead of dequeuing them one at a time. An 
+        empty queue, or a count of 0, returns no elements.
+        """
+        if not self._head or count == 0:
+            return iter(()) if lazy else []
+
+        head = self._unlink_head_chain(self._idx if count is None else count)
+        nodes = self._release_chain(head)
+        return nodes if lazy else list(nodes)
+
+    def enqueue_many(self, iterable):
+        """
+        Pushes all objects in the iterable passed as parameter to the end
+        of the queue, in that order.
+
+        Objects that are not valid node instances are converted to ones.
+        They are linked to each other in a single pass, and the chain is
+        attached to the tail in one step.
         """
-        node = self._nodify(node_or_value)
-        self.append(node)
+        self.extend(iterable)
 
     def split(self, idx):                                  
         """
@@ -85,15 +128,12 @@ class Queue(SortedSinglyLL):
 
         A valid split can only occur from index 1 onwards. 
 
-        This method is the only one intended to assign a different parameter
-        to clone(), since it is required to pass the second half of the list 
-        as a Queue instance, thus overriding the default parent class it 
-        would normally return. Check the behaviour of super().split(idx)
-        for a better understanding.
+        super().split(idx) detaches the second half without copying it, 
+        and returns it as a SortedSinglyLL. The new Queue adopts that
+        chain as it is, so no node is cloned and splitting only costs the
+        walk to the split point.
         """
-        splitted = super().split(idx)
-        second_half_clone = self.clone(splitted)
-        return second_half_clone
+        return self._adopt(super().split(idx))
 
     def __str__(self):
         return super().__str__(start="<TOP> ", end=' <END>', separator='<-')
@@ -102,8 +142,8 @@ class Queue(SortedSinglyLL):
     ################################################################
     # Uncomment the methods below if you really want to restrict   #
     # this class to the default basic behavior of a Stack. Note,   #
-    # however, that clone() and split() methods will stop working  #
-    # since they depend on super().append(), and it will be        #
+    # however, that the clone() method will stop working, since    #
+    # it depends on super().append(), and it will be               #
     # overwritten.                                                 #
     # If you choose to activate all of the following methods, then #
     # only clear(), peek(), dequeue() and enqueue() -as well as    #
@@ -129,6 +169,575 @@ class Queue(SortedSinglyLL):
     ################################################################
 
 
+class BlockingQueue(Queue):
+    """
+    A Queue that can be shared between threads: producers put() values at
+    its end and consumers get() them from its top, waiting for each other
+    when the queue is full or empty, as the standard library queue.Queue
+    does.
+
+    Every method that adds or removes nodes holds the same lock, and the
+    threads that wait for nodes, or for room for them, sleep on condition
+    variables until another thread wakes them up, instead of polling the
+    queue. The rest of the Queue methods (and its parent's) are not locked,
+    so only call them while no other thread is using the queue.
+
+    If maxsize is greater than 0, the queue holds at most that many nodes,
+    and put() waits while it is full, so producers that are faster than
+    the consumers are held back instead of growing the queue without end.
+
+    Each value put in the queue counts as an unfinished task until a 
+    consumer calls task_done() for it, and join() waits until all of them
+    are done. The values passed to the constructor are not counted.
+
+    Attributes:
+        self._maxsize : Most nodes the queue can hold, or 0 for no limit.
+        self._mutex : The lock every locked method holds.
+        self._not_empty : Condition variable get() waits on.
+        self._not_full : Condition variable put() waits on.
+        self._all_tasks_done : Condition variable join() waits on.
+        self._unfinished_tasks : Amount of values put and not marked as
+                                 done yet.
+
+    Methods:
+        __init__
+        get_maxsize : Returns the most nodes the queue can hold.
+        is_full : Returns True if the queue holds maxsize nodes.
+        put : Adds a value/node at the end of the queue, waiting for room
+              if it is full.
+        get : Removes the node from the top of the queue and returns it,
+              waiting for one if it is empty.
+        get_many : Removes up to a number of nodes from the top of the
+                   queue and returns them, waiting for at least one.
+        task_done : Marks a value got from the queue as done.
+        join : Waits until all values put in the queue are done.
+        enqueue : Same as put(), without waiting.
+        dequeue : Same as get(), without waiting.
+        enqueue_many : Locked version of Queue.enqueue_many().
+        dequeue_many : Locked version of Queue.dequeue_many().
+        clear : Locked version of Queue.clear().
+        clone : Overrides super().clone() so that a BlockingQueue with the
+                same maxsize is returned.
+        split : Locked version of Queue.split(), whose second half keeps
+                the same maxsize.
+        _has_room : Returns True if the queue can hold an amount of nodes
+                    more.
+    """
+
+    def __init__(self, *args, maxsize=0, **kwargs):
+        """
+        Creates a queue holding the values passed as args, which can hold
+        at most maxsize nodes if it is greater than 0. kwargs are passed
+        to the parent's constructor.
+        """
+        assert type(maxsize) is int and maxsize >= 0, \
+            'Maxsize must be an integer equal to or greater than 0.'
+        assert not maxsize or len(args) <= maxsize, \
+            'There are more args than the queue can hold.'
+
+        self._maxsize = maxsize
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._unfinished_tasks = 0
+        super().__init__(*args, **kwargs)
+
+    def get_maxsize(self):
+        """
+        Returns the most nodes the queue can hold, or 0 if there is no
+        limit.
+        """
+        return self._maxsize
+
+    def is_full(self):
+        """
+        Returns True if the queue has a maxsize and holds that many nodes.
+        """
+        return not self._has_room(1)
+
+    def put(self, node_or_value, block=True, timeout=None):
+        """
+        Pushes the object passed as a parameter to the end of the queue,
+        and wakes up a thread waiting in get(), if any.
+
+        If the queue is full, it waits until another thread gets a node
+        from it, for at most timeout seconds if timeout is not None. If
+        block=False, or if the timeout runs out, an OverflowError is 
+        raised instead.
+        """
+        with self._not_full:
+            if not self._has_room(1):
+                if not block or not self._not_full.wait_for(lambda: self._has_room(1), timeout):
+                    raise OverflowError('Queue is full.')
+
+            super().enqueue(node_or_value)
+            self._unfinished_tasks += 1
+            self._not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Removes the top element from the queue and returns a reference to
+        it, and wakes up a thread waiting in put(), if any.
+
+        If the queue is empty, it waits until another thread puts a node
+        in it, for at most timeout seconds if timeout is not None. If 
+        block=False, or if the timeout runs out, an IndexError is raised
+        instead.
+        """
+        with self._not_empty:
+            if not self._head:
+                if not block or not self._not_empty.wait_for(lambda: self._head, timeout):
+                    raise IndexError('Queue is empty.')
+
+            node = super().dequeue()
+            self._not_full.notify()
+            return node
+
+    def get_many(self, max_n=None, timeout=None):
+        """
+        Removes up to max_n elements from the top of the queue (all of 
+        them if max_n is None) and returns them in a list, in the order
+        they were put. They are unlinked in one step, as in dequeue_many().
+
+        If the queue is empty, it waits until another thread puts a node
+        in it, for at most timeout seconds if timeout is not None. If the
+        timeout runs out, an empty list is returned.
+        """
+        with self._not_empty:
+            if not self._head and not self._not_empty.wait_for(lambda: self._head, timeout):
+                return []
+
+            nodes = super().dequeue_many(max_n)
+            self._not_full.notify(len(nodes))
+            return nodes
+
+    def task_done(self):
+        """
+        Marks one of the values got from the queue as done. Consumers call
+        it once for each value they finish with, and join() returns when
+        every value put in the queue is done.
+
+        Raises a ValueError if it is called more times than values were
+        put in the queue.
+        """
+        with self._all_tasks_done:
+            if self._unfinished_tasks <= 0:
+                raise ValueError('task_done() called too many times.')
+
+            self._unfinished_tasks -= 1
+
+            if not self._unfinished_tasks:
+                self._all_tasks_done.notify_all()
+
+    def join(self):
+        """
+        Waits until task_done() is called for every value put in the queue.
+        """
+        with self._all_tasks_done:
+            self._all_tasks_done.wait_for(lambda: not self._unfinished_tasks)
+
+    def enqueue(self, node_or_value):
+        """
+        Same as put(), without waiting. An OverflowError is raised if the
+        queue is full.
+        """
+        self.put(node_or_value, block=False)
+
+    def dequeue(self):
+        """
+        Same as get(), without waiting. An IndexError is raised if the
+        queue is empty.
+        """
+        return self.get(block=False)
+
+    def enqueue_many(self, iterable):
+        """
+        Pushes all objects in the iterable passed as parameter to the end
+        of the queue in one step, as Queue.enqueue_many() does, holding the
+        lock. Each of them counts as an unfinished task.
+
+        An OverflowError is raised if the queue has no room for all of them,
+        in which case none is added.
+        """
+        values = list(iterable)
+
+        with self._not_full:
+            if not self._has_room(len(values)):
+                raise OverflowError('Queue is full.')
+
+            super().enqueue_many(values)
+            self._unfinished_tasks += len(values)
+            self._not_empty.notify(len(values))
+
+    def dequeue_many(self, count=None, lazy=False):
+        """
+        Removes count elements from the top of the queue in one step, as
+        Queue.dequeue_many() does, holding the lock. lazy=True still 
+        unlinks them while holding it, and only releases them lazily.
+        """
+        with self._not_empty:
+            nodes = super().dequeue_many(count)
+            self._not_full.notify(len(nodes))
+
+        return iter(nodes) if lazy else nodes
+
+    def clear(self):
+        """
+        Removes all nodes from the queue, holding the lock, and wakes up 
+        the threads waiting in put().
+        """
+        with self._not_full:
+            super().clear()
+            self._not_full.notify_all()
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the queue, as a BlockingQueue
+        with the same maxsize and no unfinished tasks.
+        """
+        with self._mutex:
+            clone = BlockingQueue(maxsize=self._maxsize, **self._options())
+            clone.extend(self)
+
+        return clone
+
+    def split(self, idx):
+        """
+        Splits the queue into two as Queue.split() does, holding the lock.
+        The second half is a BlockingQueue with the same maxsize and no
+        unfinished tasks, and the threads waiting in put() are woken up.
+        """
+        with self._not_full:
+            second_half = super().split(idx)
+            second_half._maxsize = self._maxsize
+            self._not_full.notify_all()
+
+        return second_half
+
+    def _has_room(self, count):
+        """
+        Returns True if the queue has no maxsize, or if it can hold count
+        nodes more.
+        """
+        return not self._maxsize or self._idx + count <= self._maxsize
+
+
+def _wakeup_next(waiters, result=None):
+    """
+    Wakes up the first waiter in the deque passed as parameter that is
+    still waiting, this is, the oldest coroutine waiting on it, and 
+    returns True, or False if none was. The result passed as parameter is
+    returned to it by _wait_in_line().
+    """
+    while waiters:
+        waiter = waiters.popleft()
+
+        if not waiter.done():
+            waiter.set_result(result)
+            return True
+
+    return False
+
+
+async def _wait_in_line(waiters, pass_turn=None):
+    """
+    Appends a future to the deque of waiters passed as parameter, waits
+    until another coroutine wakes it up with _wakeup_next() and returns
+    the result it was woken up with.
+
+    If the waiting coroutine is cancelled, its future leaves the line. If
+    it had already been woken up, pass_turn() is called with that result 
+    to wake up someone else in its place, so the value or room it was woken
+    up for is not left without a waiter. By default, the next waiter in the
+    same line is woken up.
+    """
+    waiter = asyncio.get_running_loop().create_future()
+    waiters.append(waiter)
+
+    if pass_turn is None:
+        pass_turn = lambda result: _wakeup_next(waiters, result)
+
+    try:
+        return await waiter
+    except BaseException:
+        waiter.cancel()
+
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+
+        if not waiter.cancelled():
+            pass_turn(waiter.result())
+
+        raise
+
+
+class AsyncQueue(Queue):
+    """
+    A Queue for coroutines running on the same asyncio event loop:
+    producers await put() and consumers await get(), and each of them is
+    suspended while the queue is full or empty, letting the loop run 
+    other coroutines, instead of polling is_empty() in a loop.
+
+    Each suspended coroutine waits on a future of its own, kept in a line
+    of getters or one of putters. Adding a value wakes up the oldest 
+    getter, and removing one wakes up the oldest putter, so coroutines are
+    served in the order they started waiting. Cancelling a waiting 
+    coroutine is safe: it leaves its line, and if it had been woken up 
+    already, it passes its turn to the next one in it.
+
+    If maxsize is greater than 0, the queue holds at most that many nodes.
+    Each value put in the queue counts as an unfinished task until a 
+    consumer calls task_done() for it, and join() waits until all of them
+    are done. The values passed to the constructor are not counted.
+
+    Coroutines of other event loops or threads must not share the queue.
+    Check BlockingQueue to share a queue between threads.
+
+    Attributes:
+        self._maxsize : Most nodes the queue can hold, or 0 for no limit.
+        self._getters : Deque of futures of the coroutines waiting in get().
+        self._putters : Deque of futures of the coroutines waiting in put().
+        self._unfinished_tasks : Amount of values put and not marked as
+                                 done yet.
+        self._finished : Event set while there are no unfinished tasks.
+
+    Methods:
+        __init__
+        get_maxsize : Returns the most nodes the queue can hold.
+        is_full : Returns True if the queue holds maxsize nodes.
+        put : Coroutine that adds a value/node at the end of the queue,
+              waiting for room if it is full.
+        put_nowait : Same as put(), without waiting.
+        get : Coroutine that removes the node from the top of the queue 
+              and returns it, waiting for one if it is empty.
+        get_nowait : Same as get(), without waiting.
+        get_many : Coroutine that removes up to a number of nodes from the
+                   top of the queue and returns them, waiting for at least
+                   one.
+        task_done : Marks a value got from the queue as done.
+        join : Coroutine that waits until all values put are done.
+        enqueue : Same as put_nowait().
+        dequeue : Same as get_nowait().
+        enqueue_many : Queue.enqueue_many() that wakes up getters.
+        dequeue_many : Queue.dequeue_many() that wakes up putters.
+        clear : Queue.clear() that wakes up putters.
+        clone : Overrides super().clone() so that an AsyncQueue with the
+                same maxsize is returned.
+        split : Queue.split() whose second half keeps the same maxsize.
+        _has_room : Returns True if the queue can hold an amount of nodes
+                    more.
+    """
+
+    def __init__(self, *args, maxsize=0, **kwargs):
+        """
+        Creates a queue holding the values passed as args, which can hold
+        at most maxsize nodes if it is greater than 0. kwargs are passed
+        to the parent's constructor.
+        """
+        assert type(maxsize) is int and maxsize >= 0, \
+            'Maxsize must be an integer equal to or greater than 0.'
+        assert not maxsize or len(args) <= maxsize, \
+            'There are more args than the queue can hold.'
+
+        self._maxsize = maxsize
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        super().__init__(*args, **kwargs)
+
+    def get_maxsize(self):
+        """
+        Returns the most nodes the queue can hold, or 0 if there is no
+        limit.
+        """
+        return self._maxsize
+
+    def is_full(self):
+        """
+        Returns True if the queue has a maxsize and holds that many nodes.
+        """
+        return not self._has_room(1)
+
+    async def put(self, node_or_value):
+        """
+        Pushes the object passed as a parameter to the end of the queue,
+        waiting until another coroutine gets a node from it if it is full.
+        """
+        while not self._has_room(1):
+            await _wait_in_line(self._putters)
+
+        self.put_nowait(node_or_value)
+
+    def put_nowait(self, node_or_value):
+        """
+        Pushes the object passed as a parameter to the end of the queue
+        and wakes up the oldest coroutine waiting in get(), if any. An
+        OverflowError is raised if the queue is full.
+        """
+        if not self._has_room(1):
+            raise OverflowError('Queue is full.')
+
+        super().enqueue(node_or_value)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        _wakeup_next(self._getters)
+
+    async def get(self):
+        """
+        Removes the top element from the queue and returns a reference to
+        it, waiting until another coroutine puts a node in it if it is 
+        empty.
+        """
+        while not self._head:
+            await _wait_in_line(self._getters)
+
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """
+        Removes the top element from the queue and returns a reference to
+        it, and wakes up the oldest coroutine waiting in put(), if any. An
+        IndexError is raised if the queue is empty.
+        """
+        if not self._head:
+            raise IndexError('Queue is empty.')
+
+        node = super().dequeue()
+        _wakeup_next(self._putters)
+        return node
+
+    async def get_many(self, max_n=None):
+        """
+        Removes up to max_n elements from the top of the queue (all of 
+        them if max_n is None) and returns them in a list, in the order
+        they were put, waiting until another coroutine puts a node in it
+        if it is empty. They are unlinked in one step, as in dequeue_many().
+        """
+        while not self._head:
+            await _wait_in_line(self._getters)
+
+        return self.dequeue_many(max_n)
+
+    def task_done(self):
+        """
+        Marks one of the values got from the queue as done. Consumers call
+        it once for each value they finish with, and join() returns when
+        every value put in the queue is done.
+
+        Raises a ValueError if it is called more times than values were
+        put in the queue.
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError('task_done() called too many times.')
+
+        self._unfinished_tasks -= 1
+
+        if not self._unfinished_tasks:
+            self._finished.set()
+
+    async def join(self):
+        """
+        Waits until task_done() is called for every value put in the queue.
+        """
+        await self._finished.wait()
+
+    def enqueue(self, node_or_value):
+        """
+        Same as put_nowait().
+        """
+        self.put_nowait(node_or_value)
+
+    def dequeue(self):
+        """
+        Same as get_nowait().
+        """
+        return self.get_nowait()
+
+    def enqueue_many(self, iterable):
+        """
+        Pushes all objects in the iterable passed as parameter to the end
+        of the queue in one step, as Queue.enqueue_many() does, and wakes
+        up as many coroutines waiting in get(). Each of them counts as an
+        unfinished task.
+
+        An OverflowError is raised if the queue has no room for all of them,
+        in which case none is added.
+        """
+        values = list(iterable)
+
+        if not self._has_room(len(values)):
+            raise OverflowError('Queue is full.')
+
+        super().enqueue_many(values)
+        self._unfinished_tasks += len(values)
+
+        if values:
+            self._finished.clear()
+
+        for _ in values:
+            if not _wakeup_next(self._getters):
+                break
+
+    def dequeue_many(self, count=None, lazy=False):
+        """
+        Removes count elements from the top of the queue in one step, as
+        Queue.dequeue_many() does, and wakes up as many coroutines waiting
+        in put().
+        """
+        nodes = super().dequeue_many(count)
+
+        for _ in nodes:
+            if not _wakeup_next(self._putters):
+                break
+
+        return iter(nodes) if lazy else nodes
+
+    def clear(self):
+        """
+        Removes all nodes from the queue, and wakes up the coroutines 
+        waiting in put().
+        """
+        super().clear()
+
+        while _wakeup_next(self._putters):
+            pass
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the queue, as an AsyncQueue
+        with the same maxsize and no unfinished tasks.
+        """
+        clone = AsyncQueue(maxsize=self._maxsize, **self._options())
+        clone.extend(self)
+        return clone
+
+    def split(self, idx):
+        """
+        Splits the queue into two as Queue.split() does. The second half is
+        an AsyncQueue with the same maxsize and no unfinished tasks, and the
+        coroutines waiting in put() are woken up.
+        """
+        second_half = super().split(idx)
+        second_half._maxsize = self._maxsize
+
+        while _wakeup_next(self._putters):
+            pass
+
+        return second_half
+
+    def _has_room(self, count):
+        """
+        Returns True if the queue has no maxsize, or if it can hold count
+        nodes more.
+        """
+        return not self._maxsize or self._idx + count <= self._maxsize
+
+
 if __name__ == '__main__':
 
 
@@ -157,6 +766,17 @@ if __name__ == '__main__':
     # print(q)                               # /dequeue
 
 
+    # q.enqueue_many(range(5))               # enqueue_many
+    # print(q)                               # /enqueue_many
+
+
+    # print(q.dequeue_many(3))               # dequeue_many
+    # print(q)                               #
+    # for node in q.dequeue_many(lazy=True): #
+    #     print(node)                        #
+    # print(q)                               # /dequeue_many
+
+
     # print(q)                               # peek
     # end = q.peek()                         #    
     # print(end)                             #
@@ -185,4 +805,34 @@ if __name__ == '__main__':
     # q.enqueue("I'm not in clone!")         #
     # clone.dequeue()                        #
     # print(q)                               #
-    # print(clone)                           # /clone
\ No newline at end of file
+    # print(clone)                           # /clone
+
+    # bq = BlockingQueue(maxsize=100)        # BlockingQueue
+    # def consumer():                        #
+    #     while True:                        #
+    #         node = bq.get()                #
+    #         print('Got', node)             #
+    #         bq.task_done()                 #
+    # threading.Thread(target=consumer,      #
+    #                  daemon=True).start()  #
+    # for i in range(5):                     #
+    #     bq.put(i)                          #
+    # bq.join()                              #
+    # print(bq.get_many(10, timeout=0.1))    # /BlockingQueue
+
+
+
+    # async def main():                      # AsyncQueue
+    #     aq = AsyncQueue(maxsize=2)         #
+    #     async def consumer():              #
+    #         while True:                    #
+    #             node = await aq.get()      #
+    #             print('Got', node)         #
+    #             aq.task_done()             #
+    #     task = asyncio.create_task(        #
+    #         consumer())                    #
+    #     for i in range(5):                 #
+    #         await aq.put(i)                #
+    #     await aq.join()                    #
+    #     task.cancel()                      #
+    # asyncio.run(main())                    # /AsyncQueue
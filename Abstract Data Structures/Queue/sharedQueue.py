@@ -0,0 +1,370 @@
+import multiprocessing
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+from modules.sortedSinglyLL import SSLL_Node
+
+class SharedQueue:
+    """
+    A Queue that can be shared between processes without pickling its
+    values through a pipe: they are copied into a ring buffer of fixed-size
+    slots laid out in a block of shared memory, which every process maps.
+
+    The block starts with two counters, of values enqueued and dequeued
+    so far, and then holds capacity slots. Each slot is the length of its
+    payload followed by slot_size bytes. Values go to the slot of the
+    enqueued counter, and come from the one of the dequeued counter, both
+    modulo the capacity, so the values never move once written.
+
+    Values can be bytes-like objects of up to slot_size bytes, which are
+    dequeued as bytes, or fixed-size records. Pass a struct format as
+    record (like '<qd' for an integer and a float) and each value must be
+    a tuple matching it, which is packed straight into its slot and
+    dequeued as a tuple again.
+
+    Two semaphores count the free and the filled slots, so enqueue() waits
+    while the queue is full and dequeue() while it is empty, and two locks
+    let one producer and one consumer work on the queue at the same time
+    without waiting for each other.
+
+    Pass the queue to other processes as an argument when starting them,
+    as with multiprocessing.Queue. The process that created it owns the
+    shared memory: call close() in every process when done, and unlink()
+    in the owner (or use the queue as a context manager there) to release
+    it. It has the enqueue/dequeue API of Queue, and dequeue() and peek()
+    return new SSLL_Nodes holding a copy of the value. The values live in
+    shared memory instead of nodes, so there are no clone() nor split().
+
+    Only the owner registers the shared memory with the multiprocessing
+    resource tracker, which unlinks it if every process exits without 
+    doing so. Other processes attach with track=False, or, before Python
+    3.13, where there is no such parameter, they unregister it right after
+    attaching if they started a resource tracker of their own, so it does
+    not unlink the block, nor warn about it leaking, when they exit. 
+    Processes started by multiprocessing share the owner's tracker, so 
+    there is nothing to unregister there.
+
+    Attributes:
+        self._capacity : Amount of slots in the ring buffer.
+        self._slot_size : Most bytes a value can take.
+        self._record : Struct the records are packed with, or None if the
+                       values are bytes.
+        self._stride : Bytes taken by each slot, its length included.
+        self._shm : The SharedMemory block holding the ring buffer.
+        self._free : Semaphore counting the free slots.
+        self._filled : Semaphore counting the slots holding values.
+        self._put_lock : Lock held while writing a value and moving the
+                         enqueued counter.
+        self._get_lock : Lock held while reading a value and moving the
+                         dequeued counter.
+        self._owner : True in the process that created the shared memory.
+
+    Methods:
+        __init__
+        __len__
+        __enter__
+        __exit__
+        __getstate__
+        __setstate__
+        get_capacity : Returns the amount of slots in the ring buffer.
+        is_empty : Returns True if the queue has no values.
+        enqueue : Copies a value at the end of the queue, waiting for a
+                  free slot if it is full.
+        enqueue_many : Copies all values in an iterable at the end of the
+                       queue.
+        dequeue : Removes the value at the top of the queue and returns a
+                  node holding it, waiting for one if it is empty.
+        dequeue_many : Removes up to a number of values from the top of
+                       the queue and returns nodes holding them.
+        peek : Returns a node holding the value at the top of the queue.
+        clear : Removes all values from the queue.
+        close : Unmaps the shared memory in this process.
+        unlink : Releases the shared memory, in the owner process.
+        _write : Writes a value to the slot of a counter.
+        _read : Reads the value in the slot of a counter.
+    """
+
+    _COUNTERS = struct.Struct('<QQ')
+    _COUNTER = struct.Struct('<Q')
+    _LENGTH = struct.Struct('<I')
+
+    def __init__(self, capacity, slot_size=64, record=None, context=None):
+        """
+        Creates the shared memory block for capacity slots, each one
+        holding up to slot_size bytes or, if a struct format is passed as
+        record, one record packed with it.
+
+        The semaphores and locks are created by the multiprocessing
+        context passed as parameter (the default one if it is None), which
+        must be the one that starts the processes sharing the queue.
+        """
+        assert type(capacity) is int and capacity > 0, \
+            'Capacity must be an integer greater than 0.'
+
+        self._record = struct.Struct(record) if record is not None else None
+        self._slot_size = self._record.size if self._record else slot_size
+
+        assert type(self._slot_size) is int and self._slot_size > 0, \
+            'Slot size must be an integer greater than 0.'
+
+        self._capacity = capacity
+        self._stride = self._LENGTH.size + self._slot_size
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._COUNTERS.size + capacity * self._stride)
+        self._COUNTERS.pack_into(self._shm.buf, 0, 0, 0)
+        context = context or multiprocessing.get_context()
+        self._free = context.Semaphore(capacity)
+        self._filled = context.Semaphore(0)
+        self._put_lock = context.Lock()
+        self._get_lock = context.Lock()
+        self._owner = True
+
+    def __len__(self):
+        """
+        Returns the amount of values in the queue. Other processes can
+        change it right after it is read.
+        """
+        enqueued, dequeued = self._COUNTERS.unpack_from(self._shm.buf, 0)
+        return enqueued - dequeued
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+        if self._owner:
+            self.unlink()
+
+    def __getstate__(self):
+        """
+        Pickles the queue by the name of its shared memory block, which the
+        other process maps again, and its record by its format. The 
+        semaphores and locks can only be pickled while starting a process.
+        """
+        state = self.__dict__.copy()
+        state['_shm'] = self._shm.name
+        state['_record'] = self._record.format if self._record else None
+        state['_owner'] = False
+        return state
+
+    def __setstate__(self, state):
+        name = state.pop('_shm')
+        self.__dict__.update(state)
+
+        if self._record is not None:
+            self._record = struct.Struct(self._record)
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            own_tracker = getattr(resource_tracker._resource_tracker, '_fd', None) is None
+            self._shm = shared_memory.SharedMemory(name=name)
+
+            if own_tracker:
+                resource_tracker.unregister(self._shm._name, 'shared_memory')
+
+    def get_capacity(self):
+        """
+        Returns the amount of slots in the ring buffer, this is, how many
+        values the queue can hold.
+        """
+        return self._capacity
+
+    def is_empty(self):
+        """
+        Returns True if the queue has no values.
+        """
+        return len(self) == 0
+
+    def enqueue(self, node_or_value, block=True, timeout=None):
+        """
+        Copies the value, or the value of the node, passed as parameter to
+        the end of the queue.
+
+        If the queue is full, it waits until another process dequeues a
+        value, for at most timeout seconds if timeout is not None. If
+        block=False, or if the timeout runs out, an OverflowError is
+        raised instead. Values that do not fit a slot raise a ValueError,
+        and values that cannot be written to one, like str payloads or 
+        tuples not matching the record, raise the error of packing them.
+        Either way, the queue is left as it was.
+        """
+        value = node_or_value.value if isinstance(node_or_value, SSLL_Node) else node_or_value
+
+        if not self._record and len(value) > self._slot_size:
+            raise ValueError(f'Values cannot take more than {self._slot_size} bytes.')
+
+        if not self._free.acquire(block, timeout):
+            raise OverflowError('Queue is full.')
+
+        with self._put_lock:
+            enqueued, = self._COUNTER.unpack_from(self._shm.buf, 0)
+
+            try:
+                self._write(enqueued, value)
+            except BaseException:
+                self._free.release()
+                raise
+
+            self._COUNTER.pack_into(self._shm.buf, 0, enqueued + 1)
+
+        self._filled.release()
+
+    def enqueue_many(self, iterable, block=True, timeout=None):
+        """
+        Copies all values or nodes in the iterable passed as parameter to
+        the end of the queue, in that order, as enqueue() does with each
+        of them.
+        """
+        for node_or_value in iterable:
+            self.enqueue(node_or_value, block, timeout)
+
+    def dequeue(self, block=True, timeout=None):
+        """
+        Removes the value at the top of the queue and returns a new
+        SSLL_Node holding a copy of it.
+
+        If the queue is empty, it waits until another process enqueues a
+        value, for at most timeout seconds if timeout is not None. If
+        block=False, or if the timeout runs out, an IndexError is raised
+        instead.
+        """
+        if not self._filled.acquire(block, timeout):
+            raise IndexError('Queue is empty.')
+
+        with self._get_lock:
+            dequeued, = self._COUNTER.unpack_from(self._shm.buf, self._COUNTER.size)
+            value = self._read(dequeued)
+            self._COUNTER.pack_into(self._shm.buf, self._COUNTER.size, dequeued + 1)
+
+        self._free.release()
+        return SSLL_Node(value)
+
+    def dequeue_many(self, count=None, lazy=False):
+        """
+        Removes up to count values from the top of the queue (all of them
+        if count is None) without waiting, and returns new SSLL_Nodes
+        holding them, in the order they were enqueued, in a list. If
+        lazy=True, an iterator over them is returned instead.
+
+        The values are read while holding the lock only once.
+        """
+        taken = 0
+
+        while (count is None or taken < count) and self._filled.acquire(False):
+            taken += 1
+
+        with self._get_lock:
+            dequeued, = self._COUNTER.unpack_from(self._shm.buf, self._COUNTER.size)
+            nodes = [SSLL_Node(self._read(dequeued + i)) for i in range(taken)]
+            self._COUNTER.pack_into(self._shm.buf, self._COUNTER.size, dequeued + taken)
+
+        for _ in range(taken):
+            self._free.release()
+
+        return iter(nodes) if lazy else nodes
+
+    def peek(self):
+        """
+        Returns a new SSLL_Node holding a copy of the value at the top of
+        the queue, or None if the queue is empty.
+        """
+        with self._get_lock:
+            enqueued, dequeued = self._COUNTERS.unpack_from(self._shm.buf, 0)
+
+            if enqueued == dequeued:
+                return None
+
+            return SSLL_Node(self._read(dequeued))
+
+    def clear(self):
+        """
+        Removes all values from the queue.
+        """
+        self.dequeue_many()
+
+    def close(self):
+        """
+        Unmaps the shared memory in this process. The queue cannot be used
+        in it afterwards.
+        """
+        self._shm.close()
+
+    def unlink(self):
+        """
+        Releases the shared memory block. Only the process that created
+        the queue can do it, once every process is done with it.
+        """
+        assert self._owner, 'Only the process that created the queue can unlink it.'
+        self._shm.unlink()
+
+    def _write(self, counter, value):
+        """
+        Writes the value to the slot of the counter passed as parameter,
+        packing it if the queue holds records.
+        """
+        offset = self._COUNTERS.size + counter % self._capacity * self._stride
+        buf = self._shm.buf
+
+        if self._record:
+            self._record.pack_into(buf, offset + self._LENGTH.size, *value)
+            size = self._record.size
+        else:
+            size = len(value)
+            buf[offset + self._LENGTH.size:offset + self._LENGTH.size + size] = value
+
+        self._LENGTH.pack_into(buf, offset, size)
+
+    def _read(self, counter):
+        """
+        Returns a copy of the value in the slot of the counter passed as
+        parameter, as bytes, or as a tuple if the queue holds records.
+        """
+        offset = self._COUNTERS.size + counter % self._capacity * self._stride
+        buf = self._shm.buf
+
+        if self._record:
+            return self._record.unpack_from(buf, offset + self._LENGTH.size)
+
+        size, = self._LENGTH.unpack_from(buf, offset)
+        return bytes(buf[offset + self._LENGTH.size:offset + self._LENGTH.size + size])
+
+
+def _consumer(sq, count):
+    for _ in range(count):
+        print('Consumer got', sq.dequeue())
+
+    sq.close()
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    with SharedQueue(4, slot_size=16) as sq:
+        sq.enqueue(b'Hello')
+        sq.enqueue(b'shared memory')
+        print(len(sq), sq.peek())                   # __len__, peek
+
+        # consumer = multiprocessing.Process(         # dequeue
+        #     target=_consumer, args=(sq, 3))         #
+        # consumer.start()                            #
+        # sq.enqueue(b'from the parent')              #
+        # consumer.join()                             # /dequeue
+
+        # print(sq.dequeue_many())                    # dequeue_many
+
+        # try:                                        # slot_size
+        #     sq.enqueue(b'Does not fit in a slot')   #
+        # except ValueError as error:                 #
+        #     print(error)                            # /slot_size
+
+    # with SharedQueue(4, record='<qd') as records:   # record
+    #     records.enqueue((1, 0.5))                   #
+    #     print(records.dequeue())                    # /record
@@ -0,0 +1,608 @@
+import threading
+
+from sortedSinglyLL import SortedSinglyLL
+
+
+class ConcurrentSortedSinglyLL(SortedSinglyLL):
+    """
+    A SortedSinglyLL that can be shared between threads without wrapping
+    every call in one global lock.
+
+    Every method is guarded by a readers-writer lock (_RWLock) with three
+    ways in:
+
+        Readers (iteration, lookups, indexOf, __contains__, __eq__,
+        get_nodes, render...) share the lock with other readers, so
+        traversals run side by side.
+
+        End operations (append, prepend, pop() and pop(0)) share the lock
+        with each other, but not with readers. On top of it, the ones at
+        the head take _head_lock and the ones at the tail take _tail_lock,
+        so a thread pushing or popping at one end never waits for a thread
+        working at the other one. The list length, base, fingerprint and
+        value map they share are updated under _state_lock, which is only
+        held for a handful of assignments. When the list is too short for
+        both ends to be apart (no nodes before a push, less than three
+        before a pop), the operation takes both end locks instead.
+
+        Any other mutation (insert, insert_many, extend, __setitem__,
+        set_nodes, map_inplace, filter_inplace, remove_all, split, clear,
+        add...) takes the lock exclusively.
+
+    Iterators work on a snapshot of the values taken while holding the
+    read lock, so the lock is never held while the loop body runs, and
+    the list can be changed from inside the loop. The lock is reentrant
+    for the thread holding it, which lets locked methods call each other,
+    but a reader cannot become a writer: mutating the list from a method
+    that holds the read lock raises a RuntimeError.
+
+    split(), clone() and slicing return ConcurrentSortedSinglyLL objects.
+    Nodes popped by pop() and pop(0) concurrently are unlinked just like
+    in SortedSinglyLL.
+
+    Attributes:
+        Same as in SortedSinglyLL, plus:
+        self._lock : The _RWLock guarding the list.
+        self._head_lock : Lock taken by operations at the head.
+        self._tail_lock : Lock taken by operations at the tail.
+        self._state_lock : Lock guarding the length, base, fingerprint
+                           and value map while both ends are in use.
+
+    Methods:
+        Same as in SortedSinglyLL, plus:
+        _pop_head : Unlinks the head node, or hands over to pop() while
+                    holding both end locks.
+        _pop_tail : Unlinks the tail node, or hands over to pop() while
+                    holding both end locks.
+        _node_behind_tail : Walks to the node before the tail, starting
+                    over if the node it stands on is popped from the head.
+        _get_fingerprint : Computes the fingerprint again, if needed,
+                    holding the read lock and _state_lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates the locks and initializes the list as SortedSinglyLL does.
+        kwargs are passed to its constructor.
+        """
+        self._lock = _RWLock()
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def __iter__(self):
+        with self._lock.shared('read'):
+            values = list(super().__iter__())
+
+        return iter(values)
+
+    def __contains__(self, node):
+        with self._lock.shared('read'):
+            return super().__contains__(node)
+
+    def __getitem__(self, idx):
+        with self._lock.shared('read'):
+            result = super().__getitem__(idx)
+
+        if type(idx) is slice:
+            return self._adopt(result)
+
+        return result
+
+    def __setitem__(self, idx, value):
+        with self._lock.exclusive():
+            super().__setitem__(idx, value)
+
+    def __eq__(self, ssll):
+        """
+        Compares holding the read lock of both lists when ssll is also a
+        ConcurrentSortedSinglyLL, so it cannot change while it is walked.
+        The locks are taken in id() order, so two threads comparing a == b
+        and b == a cannot deadlock. See SortedSinglyLL.__eq__.
+        """
+        if not isinstance(ssll, ConcurrentSortedSinglyLL) or ssll is self:
+            with self._lock.shared('read'):
+                return super().__eq__(ssll)
+
+        first, second = sorted((self, ssll), key=id)
+
+        with first._lock.shared('read'), second._lock.shared('read'):
+            return super().__eq__(ssll)
+
+    def _get_fingerprint(self):
+        """
+        Returns the list fingerprint as SortedSinglyLL does, holding the
+        read lock, and _state_lock while it is computed again, so readers
+        sharing the lock do not write the cached fingerprint, _power and
+        _opaque at the same time.
+        """
+        with self._lock.shared('read'):
+            if self._fingerprint is not None:
+                return self._fingerprint
+
+            with self._state_lock:
+                return super()._get_fingerprint()
+
+    def get_nodes(self, **kwargs):
+        with self._lock.shared('read'):
+            return super().get_nodes(**kwargs)
+
+    def set_nodes(self, value, **kwargs):
+        with self._lock.exclusive():
+            super().set_nodes(value, **kwargs)
+
+    def map_inplace(self, fn):
+        with self._lock.exclusive():
+            super().map_inplace(fn)
+
+    def filter_inplace(self, pred):
+        with self._lock.exclusive():
+            return super().filter_inplace(pred)
+
+    def remove_all(self, node_or_value):
+        with self._lock.exclusive():
+            return super().remove_all(node_or_value)
+
+    def iter_range(self, start=0, stop=None, step=1):
+        """
+        Returns an iterator over a snapshot of the values in the range,
+        taken while holding the read lock. See SortedSinglyLL.iter_range.
+        """
+        with self._lock.shared('read'):
+            values = list(super().iter_range(start, stop, step))
+
+        return iter(values)
+
+    def iter_between(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Returns an iterator over a snapshot of the values between two
+        keys, taken while holding the read lock. See
+        SortedSinglyLL.iter_between.
+        """
+        with self._lock.shared('read'):
+            values = list(super().iter_between(low, high, inclusive))
+
+        return iter(values)
+
+    def add(self, node_or_value):
+        with self._lock.exclusive():
+            return super().add(node_or_value)
+
+    def bisect_left(self, node_or_value):
+        with self._lock.shared('read'):
+            return super().bisect_left(node_or_value)
+
+    def bisect_right(self, node_or_value):
+        with self._lock.shared('read'):
+            return super().bisect_right(node_or_value)
+
+    def indexOf(self, node_or_value):
+        with self._lock.shared('read'):
+            return super().indexOf(node_or_value)
+
+    def valueOf(self, idx):
+        with self._lock.shared('read'):
+            return super().valueOf(idx)
+
+    def clear(self):
+        with self._lock.exclusive():
+            super().clear()
+
+    def append(self, node_or_value):
+        """
+        Appends the value or node at the tail holding only the tail lock,
+        unless the list is empty. See SortedSinglyLL.append.
+        """
+        node = self._nodify(node_or_value)
+
+        with self._lock.shared('ends'):
+            with self._tail_lock:
+                with self._state_lock:
+                    apart = self._idx >= 1
+
+                    if apart:
+                        node._idx = self._base + self._idx
+                        self._idx += 1
+
+                        if self._fingerprint is not None:
+                            self._fingerprint = (self._fingerprint +
+                                self._fingerprint_of(node.value) * self._power) % self._FP_MOD
+                            self._power = self._power * self._FP_BASE % self._FP_MOD
+
+                        if self._value_map is not None:
+                            self._map_value(node)
+
+                if apart:
+                    self._tail._next = node
+                    self._tail = node
+
+                    if self._lanes is not None:
+                        self._add_lane(node)
+
+                    return
+
+            with self._head_lock, self._tail_lock:
+                super().append(node)
+
+    def extend(self, iterable):
+        with self._lock.exclusive():
+            super().extend(iterable)
+
+    def prepend(self, node_or_value):
+        """
+        Prepends the value or node at the head holding only the head lock,
+        unless the list is empty. See SortedSinglyLL.prepend.
+        """
+        node = self._nodify(node_or_value)
+
+        with self._lock.shared('ends'):
+            with self._head_lock:
+                with self._state_lock:
+                    apart = self._idx >= 1
+
+                    if apart:
+                        self._base -= 1
+                        self._idx += 1
+                        node._idx = self._base
+
+                        if self._fingerprint is not None:
+                            self._fingerprint = (self._fingerprint * self._FP_BASE +
+                                self._fingerprint_of(node.value)) % self._FP_MOD
+                            self._power = self._power * self._FP_BASE % self._FP_MOD
+
+                        if self._value_map is not None:
+                            self._map_value(node)
+
+                if apart:
+                    node._next = self._head
+                    self._head = node
+
+                    if self._lanes is not None:
+                        self._add_lane(node)
+
+                    return
+
+            with self._head_lock, self._tail_lock:
+                super().prepend(node)
+
+    def insert(self, node_or_value, position):
+        with self._lock.exclusive():
+            super().insert(node_or_value, position)
+
+    def insert_many(self, position, iterable):
+        with self._lock.exclusive():
+            super().insert_many(position, iterable)
+
+    def pop(self, idx=None):
+        """
+        Pops the node at the index passed as parameter, as in
+        SortedSinglyLL.pop. Pops at the tail (the default) and at the
+        head (index 0) only hold the lock for their own end.
+        """
+        if idx is None:
+            return self._pop_tail()
+
+        if idx == 0:
+            return self._pop_head()
+
+        with self._lock.exclusive():
+            return super().pop(idx)
+
+    def render(self, fp, limit=None, indexed=False, start=">> ", end=" >/>", separator='->'):
+        with self._lock.shared('read'):
+            super().render(fp, limit, indexed, start, end, separator)
+
+    def split(self, idx):
+        with self._lock.exclusive():
+            return self._adopt(super().split(idx))
+
+    def clone(self):
+        with self._lock.shared('read'):
+            assert self._head, 'Cannot clone an empty list.'
+
+            values = list(super().__iter__())
+
+        clone = self.__class__(**self._options())
+        clone.extend(values)
+        return clone
+
+    def dump(self, fp):
+        with self._lock.shared('read'):
+            super().dump(fp)
+
+    def _pop_head(self):
+        """
+        Unlinks and returns the head node holding only the head lock, if
+        the list has at least three nodes. Otherwise, pop(0) is called
+        holding both end locks.
+        """
+        with self._lock.shared('ends'):
+            with self._head_lock:
+                with self._state_lock:
+                    apart = self._idx >= 3
+
+                    if apart:
+                        node = self._head
+                        self._base += 1
+                        self._idx -= 1
+
+                        if self._fingerprint is not None:
+                            self._fingerprint = (self._fingerprint - self._fingerprint_of(node.value)) * \
+                                self._FP_INVERSE % self._FP_MOD
+                            self._power = self._power * self._FP_INVERSE % self._FP_MOD
+
+                        if self._value_map is not None:
+                            self._unmap_value(node)
+
+                if apart:
+                    self._head = node._next
+
+                    if self._lanes is not None:
+                        self._lanes.pop(node._idx, None)
+
+                    node._idx = None
+                    node._next = None
+                    return node
+
+            with self._head_lock, self._tail_lock:
+                return super().pop(0)
+
+    def _pop_tail(self):
+        """
+        Unlinks and returns the tail node holding only the tail lock, if
+        the list has at least three nodes. Otherwise, pop() is called
+        holding both end locks.
+        """
+        with self._lock.shared('ends'):
+            with self._tail_lock:
+                with self._state_lock:
+                    apart = self._idx >= 3
+
+                    if apart:
+                        node = self._tail
+                        self._idx -= 1
+
+                        if self._fingerprint is not None:
+                            self._power = self._power * self._FP_INVERSE % self._FP_MOD
+                            self._fingerprint = (self._fingerprint -
+                                self._fingerprint_of(node.value) * self._power) % self._FP_MOD
+
+                        if self._value_map is not None:
+                            self._unmap_value(node)
+
+                if apart:
+                    node_behind = self._node_behind_tail()
+                    node_behind._next = None
+                    self._tail = node_behind
+
+                    if self._lanes is not None:
+                        self._lanes.pop(node._idx, None)
+
+                    node._idx = None
+                    return node
+
+            with self._head_lock, self._tail_lock:
+                return super().pop()
+
+    def _node_behind_tail(self):
+        """
+        Returns the node before the tail, walking from the closest express
+        lane, if any, or from the head.
+
+        Pops at the head may unlink the node the walk stands on, whose
+        _next is then None. If that happens, the walk starts over from the
+        new head. The list is guaranteed to keep at least one node before
+        the tail while the tail lock is held, so the walk always ends.
+        """
+        idx = self._tail._idx - 1
+        current = None
+
+        if self._lanes:
+            current = self._lanes.get(idx - idx % self._LANE_STRIDE)
+
+        while True:
+            if current is None:
+                current = self._head
+
+            while current is not None and current._idx != idx:
+                current = current._next
+
+            if current is not None:
+                return current
+
+
+class _RWLock:
+    """
+    A readers-writer lock with two groups of shared holders.
+
+    Threads in the same group ('read' or 'ends') hold the lock at the
+    same time, while the two groups take turns: once a thread of one
+    group waits for the other group to finish, newcomers of the other
+    group wait for it to have its turn. Writers hold the lock alone and
+    go first: no thread of either group gets the lock while a writer is
+    waiting for it.
+
+    The lock is reentrant for the thread holding it. A thread holding it
+    exclusively can take it again in any way, and a thread holding it in
+    one group can take it again in that same group. Any other nested
+    acquisition raises a RuntimeError, since it could never be granted.
+
+    shared() and exclusive() return context managers created once per
+    lock, so taking the lock does not create any objects.
+
+    Attributes:
+        self._condition : Condition variable all waiting threads wait on.
+        self._active : Dictionary with the amount of threads holding the
+                       lock in each group.
+        self._waiting : Dictionary with the amount of threads waiting to
+                        hold the lock in each group.
+        self._turn : The group to let in next when both are waiting.
+        self._writer : True while a thread holds the lock exclusively.
+        self._waiting_writers : Amount of threads waiting to write.
+        self._holds : Thread local storage with the way the current
+                      thread holds the lock, if it does, and how many
+                      times it took it.
+        self._managers : Dictionary with the context manager of each way
+                         to take the lock.
+
+    Methods:
+        shared : Returns the context manager that holds the lock in a 
+                 group.
+        exclusive : Returns the context manager that holds the lock alone.
+        acquire : Takes the lock in a group, or exclusively.
+        release : Releases the lock taken by acquire.
+    """
+
+    _GROUPS = ('read', 'ends')
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._active = dict.fromkeys(self._GROUPS, 0)
+        self._waiting = dict.fromkeys(self._GROUPS, 0)
+        self._turn = None
+        self._writer = False
+        self._waiting_writers = 0
+        self._holds = threading.local()
+        self._managers = {mode: _LockHold(self, mode) for mode in self._GROUPS + ('exclusive',)}
+
+    def shared(self, group):
+        """
+        Returns a context manager that holds the lock in the group passed
+        as parameter ('read' or 'ends') while the with block runs.
+        """
+        return self._managers[group]
+
+    def exclusive(self):
+        """
+        Returns a context manager that holds the lock alone while the with
+        block runs.
+        """
+        return self._managers['exclusive']
+
+    def acquire(self, mode):
+        """
+        Takes the lock in the group passed as parameter, or alone if it is
+        'exclusive', waiting as long as needed.
+        """
+        holds = self._holds
+        held = getattr(holds, 'mode', None)
+
+        if held is not None:
+            if held == 'exclusive' or held == mode:
+                holds.depth += 1
+                return
+
+            raise RuntimeError(f'Cannot take the lock as "{mode}" while holding it as "{held}".')
+
+        with self._condition:
+            if mode == 'exclusive':
+                self._waiting_writers += 1
+
+                while self._writer or any(self._active.values()):
+                    self._condition.wait()
+
+                self._waiting_writers -= 1
+                self._writer = True
+            else:
+                other = 'ends' if mode == 'read' else 'read'
+                self._waiting[mode] += 1
+
+                while self._writer or self._waiting_writers or self._active[other] or \
+                        (self._waiting[other] and self._turn == other):
+
+                    if self._active[other]:
+                        self._turn = mode
+
+                    self._condition.wait()
+
+                self._waiting[mode] -= 1
+                self._active[mode] += 1
+
+        holds.mode = mode
+        holds.depth = 1
+
+    def release(self):
+        """
+        Releases the lock taken by the last call to acquire in this thread,
+        waking up waiting threads once it is not held anymore.
+        """
+        holds = self._holds
+        holds.depth -= 1
+
+        if holds.depth:
+            return
+
+        mode = holds.mode
+        holds.mode = None
+
+        with self._condition:
+            if mode == 'exclusive':
+                self._writer = False
+                self._condition.notify_all()
+            else:
+                other = 'ends' if mode == 'read' else 'read'
+                self._active[mode] -= 1
+
+                if not self._active[mode]:
+                    if self._waiting[other]:
+                        self._turn = other
+
+                    self._condition.notify_all()
+
+
+class _LockHold:
+    """
+    Context manager that takes a _RWLock in the given way when entering
+    a with block and releases it when leaving it.
+    """
+    __slots__ = ('_lock', '_mode')
+
+    def __init__(self, lock, mode):
+        self._lock = lock
+        self._mode = mode
+
+    def __enter__(self):
+        self._lock.acquire(self._mode)
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    cssll = ConcurrentSortedSinglyLL(*range(10))
+
+    print(cssll)                                    # __str__
+
+    # def push_and_pop(times):                        # append/prepend/pop
+    #     for i in range(times):                      #
+    #         cssll.append(i)                         #
+    #         cssll.prepend(-i)                       #
+    #         cssll.pop()                             #
+    #         cssll.pop(0)                            #
+    #                                                 #
+    # threads = [threading.Thread(target=push_and_pop,#
+    #            args=(1000,)) for _ in range(4)]     #
+    # for thread in threads:                          #
+    #     thread.start()                              #
+    # for thread in threads:                          #
+    #     thread.join()                               #
+    # print(cssll)                                    # /append/prepend/pop
+
+    # for value in cssll:                             # __iter__
+    #     if value % 2:                               #
+    #         cssll.append(value * 10)                #
+    # print(cssll)                                    # /__iter__
+
+    # second_half = cssll.split(5)                    # split
+    # print(type(second_half).__name__)               #
+    # print(cssll)                                    #
+    # print(second_half)                              # /split
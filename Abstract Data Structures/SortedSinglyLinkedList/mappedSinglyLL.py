@@ -0,0 +1,182 @@
+import mmap
+import pickle
+
+from sortedSinglyLL import SortedSinglyLL
+
+
+class MappedSortedSinglyLL:
+    """
+    A read-only view of a file saved by SortedSinglyLL.dump() (or by the
+    dump() of any of its children, like Stack or Queue).
+
+    The file is memory-mapped instead of read, and opening it only reads
+    its header and footer, so it takes the same time no matter how big
+    the file is. Values are unpickled only when they are accessed:
+    iterating reads the records one after the other, and indexing reads
+    the offset of the record from the table at the end of the file, so
+    any value is reached in constant time. No nodes are created, call
+    load() to get a list back.
+
+    Values are unpickled, so only open files you trust. The dump must
+    take the whole file, and the file must not be changed while the view
+    is open. Use the view as a context manager, or call close(), to
+    release the file.
+
+    Attributes:
+        self._file : The file object the view was opened from.
+        self._map : The read-only memory map of the file.
+        self._idx : Amount of values in the file, as in SortedSinglyLL.
+        self._table : Offset of the table of record offsets.
+
+    Methods:
+        __init__
+        __len__
+        __iter__ : Generator that yields each value in the file.
+        __getitem__ : Gets the value at an index, or a list with the
+                values in a slice.
+        __enter__
+        __exit__
+        iter_range : Generator that yields the values from a start index to
+                a stop one.
+        valueOf : Gets the value at an index.
+        load : Creates a list holding all values in the file.
+        close : Closes the memory map and the file.
+        _read_value : Unpickles the value of the record at an offset.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the file in the path passed as parameter, maps it and checks
+        its header and footer.
+        """
+        self._file = open(path, 'rb')
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('The dump is truncated.')
+
+        header, footer = SortedSinglyLL._DUMP_HEADER, SortedSinglyLL._DUMP_FOOTER
+
+        if len(self._map) < header.size + footer.size:
+            self.close()
+            raise ValueError('The dump is truncated.')
+
+        magic, version, self._idx = header.unpack_from(self._map, 0)
+        self._table, end_magic = footer.unpack_from(self._map, len(self._map) - footer.size)
+
+        if magic != SortedSinglyLL._DUMP_MAGIC or version != SortedSinglyLL._DUMP_VERSION \
+                or end_magic != SortedSinglyLL._DUMP_MAGIC:
+            self.close()
+            raise ValueError('Not a list dump, or a dump of another version.')
+
+    def __len__(self):
+        return self._idx
+
+    def __iter__(self):
+        offset = SortedSinglyLL._DUMP_HEADER.size
+        read_value = self._read_value
+        length = SortedSinglyLL._DUMP_LENGTH
+
+        for _ in range(self._idx):
+            yield read_value(offset)
+            offset += length.size + length.unpack_from(self._map, offset)[0]
+
+    def __getitem__(self, idx):
+        if type(idx) is slice:
+            return list(self.iter_range(idx.start, idx.stop, idx.step))
+
+        if idx < 0:
+            idx += self._idx
+
+        if not 0 <= idx < self._idx:
+            raise IndexError('Index out of range.')
+
+        offset_struct = SortedSinglyLL._DUMP_OFFSET
+        offset, = offset_struct.unpack_from(self._map, self._table + idx * offset_struct.size)
+        return self._read_value(offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def iter_range(self, start=None, stop=None, step=None):
+        """
+        Generator that yields the values from the start index (included)
+        to the stop one (excluded), every step values. Indexes work as in
+        Python slices, so step can be negative too.
+        """
+        for idx in range(*slice(start, stop, step).indices(self._idx)):
+            yield self[idx]
+
+    def valueOf(self, idx):
+        """
+        Returns the value of the index passed as parameter.
+        """
+        return self[idx]
+
+    def load(self, list_class=SortedSinglyLL, **kwargs):
+        """
+        Creates and returns an instance of list_class (SortedSinglyLL by
+        default, or any of its children) holding all values in the file,
+        in order. kwargs are passed to its constructor.
+        """
+        new_list = list_class(**kwargs)
+        new_list.extend(self)
+        return new_list
+
+    def close(self):
+        """
+        Closes the memory map and the file. The view cannot be used
+        afterwards.
+        """
+        self._map.close()
+        self._file.close()
+
+    def _read_value(self, offset):
+        """
+        Returns the unpickled value of the record at the offset passed
+        as parameter.
+        """
+        length = SortedSinglyLL._DUMP_LENGTH
+        size, = length.unpack_from(self._map, offset)
+        start = offset + length.size
+        return pickle.loads(self._map[start:start + size])
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    import os
+    import tempfile
+
+    ssll = SortedSinglyLL('Hello', 1, {'a': 1}, 0.5, [1,False], {1,"b"}, [])
+
+    # The file is written to a temporary folder, removed afterwards.
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'ssll.bin')
+
+        with open(path, 'wb') as fp:
+            ssll.dump(fp)
+
+        with MappedSortedSinglyLL(path) as view:
+            print(len(view))                            # __len__
+
+            # print(list(view))                           # __iter__
+
+            # print(view[2])                              # __getitem__
+            # print(view[-1])                             #
+            # print(view[1:5:2])                          # /__getitem__
+
+            # print(list(view.iter_range(4, 1, -1)))      # iter_range
+
+            # print(view.load())                          # load
@@ -0,0 +1,474 @@
+from array import array
+
+from sortedSinglyLL import SSLL_Node
+
+class PooledSortedSinglyLL:
+    """
+    An alternative storage engine for SortedSinglyLL, which keeps the same
+    public behavior without creating one Python object per node.
+
+    Values are stored in a pool of slots: a list holds the value of each
+    slot, and an array of signed integers holds the slot that follows it,
+    or -1 at the end of the list.
+    That is, each slot is a node, its position in both arrays is its
+    address, and the second array stands for the nodes' _next fields.
+
+    Slots released by pop(), split() or clear() are linked to a free-list
+    (through the same next array) and reused by the following insertions,
+    so the pool only grows when every slot is taken. When that happens,
+    both the list and the array are extended to twice their capacity.
+
+    Each value takes two 8-byte slots (the next array holds 64-bit 
+    integers on every platform), instead of a 56-byte SSLL_Node
+    tracked by the garbage collector, so the pool needs less memory and
+    fewer allocations per value. Keep in mind that indexing a slot in 
+    Python code is not faster than following a _next attribute: the pool
+    saves memory, not time.
+
+    Since there are no node instances, nodes passed as arguments are
+    stored by their value, and pop() returns a new, unlinked SSLL_Node
+    holding the removed value. Also, split() copies the second half to the
+    new list's own pool.
+
+    Attributes:
+        self._values : List holding the value of each slot.
+        self._next : array of slots holding the next slot of each one.
+        self._capacity : Amount of slots in the pool.
+        self._min_capacity : Capacity the pool starts with, and goes back
+                             to when it is cleared.
+        self._head : Slot of the first value, or -1 if the list is empty.
+        self._tail : Slot of the last value, or -1 if the list is empty.
+        self._free : First slot of the free-list, or -1 if it is empty.
+        self._used : Amount of slots that were ever taken from the pool.
+                     Slots from this one onwards have never been used.
+        self._idx : The list length, as in SortedSinglyLL.
+
+    Methods:
+        __init__
+        __len__
+        __str__
+        __iter__
+        __contains__
+        __getitem__
+        __setitem__
+        __eq__
+        get_capacity : Returns the amount of slots in the pool.
+        get_list_index : Gets the current list index.
+        get_nodes : Same as in SortedSinglyLL.
+        indexOf : Same as in SortedSinglyLL.
+        is_empty : Returns True if the list has no values.
+        valueOf : Same as in SortedSinglyLL.
+        clear : Releases all slots and shrinks the pool to its initial
+                capacity.
+        append : Inserts a value/node at the end of the list.
+        prepend : Inserts a value/node at the beginning of the list.
+        insert : Inserts a value/node at the given index position.
+        pop : Removes the value at the given index. Defaults to the tail.
+        pprint : Prints each value with its index.
+        split : Splits the list in two starting at the given index.
+        clone : Creates and returns a shallow copy of the list.
+        _take_slot : Takes a slot from the free-list or the pool.
+        _release_slot : Returns a slot to the free-list.
+        _grow : Doubles the pool capacity.
+        _find_by_index : Returns the slot at the given index and the slot
+                        before it.
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self, *args, capacity=None):
+        """
+        Initializes the pool with enough capacity for the values passed as
+        args, or for the amount of values in capacity if it is greater,
+        and appends the values in that order.
+        """
+        self._min_capacity = max(capacity or self._INITIAL_CAPACITY, 1)
+        self._capacity = max(self._min_capacity, len(args))
+        self._values = [None] * self._capacity
+        self._next = array('q', [-1]) * self._capacity
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._used = 0
+        self._idx = 0
+
+        for arg in args:
+            self.append(arg)
+
+    def __len__(self):
+        return self._idx
+
+    def __str__(self, start=">> ", end=" >/>", separator='->'):
+        return start + f' {separator} '.join([str(value) for value in self]) + end
+
+    def __iter__(self):
+        values = self._values
+        next_slots = self._next
+        slot = self._head
+
+        while slot != -1:
+            yield values[slot]
+            slot = next_slots[slot]
+
+    def __contains__(self, node_or_value):
+        value = repr(self._unwrap(node_or_value))
+
+        for current in self:
+            if repr(current) == value:
+                return True
+
+        return False
+
+    def __getitem__(self, idx):
+        slot, _ = self._find_by_index(idx)
+
+        if slot == -1:
+            raise IndexError('Index out of range.')
+
+        return self._values[slot]
+
+    def __setitem__(self, idx, node_or_value):
+        slot, _ = self._find_by_index(idx)
+
+        if slot == -1:
+            raise IndexError('Index out of range.')
+
+        self._values[slot] = self._unwrap(node_or_value)
+
+    def __eq__(self, other):
+        """
+        Returns True if both lists hold values with the same repr in the
+        same order. other can be any iterable list, like a SortedSinglyLL.
+        """
+        if len(self) != len(other):
+            return False
+
+        for one, two in zip(self, other):
+            if repr(one) != repr(two):
+                return False
+
+        return True
+
+    def get_capacity(self):
+        """
+        Returns the amount of slots in the pool.
+        """
+        return self._capacity
+
+    def get_list_index(self):
+        """
+        Returns the current list index.
+        """
+        return len(self)
+
+    def get_nodes(self, **kwargs):
+        """
+        Returns a tuple with all values in the list.
+
+        If indexed=True, each value will be in its own tuple in the format
+        of (index, value).
+        """
+        if kwargs.get('indexed'):
+            return tuple(enumerate(self))
+
+        return tuple(self)
+
+    def indexOf(self, node_or_value):
+        """
+        Returns a tuple containing the indexes of the values whose repr
+        match the one of the value or node's value passed as parameter.
+        """
+        value = repr(self._unwrap(node_or_value))
+        indexes = tuple([i for i, current in enumerate(self) if repr(current) == value])
+
+        if not indexes:
+            raise ValueError('Value not in list.')
+
+        return indexes
+
+    def is_empty(self):
+        """
+        Returns True if the list has no values.
+        """
+        return self._head == -1
+
+    def valueOf(self, idx):
+        """
+        Returns the value of the index passed as parameter.
+        """
+        return self[idx]
+
+    def clear(self):
+        """
+        Releases every slot and replaces the pool with a new one of the
+        capacity it started with, so the values can be garbage collected.
+        """
+        self.__init__(capacity=self._min_capacity)
+
+    def append(self, node_or_value):
+        """
+        Stores the value in a free slot and links it after the tail.
+
+        If a SSLL_Node is passed as a parameter, its value is stored.
+        """
+        slot = self._take_slot(node_or_value)
+
+        if self._head == -1:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+
+        self._tail = slot
+        self._idx += 1
+
+    def prepend(self, node_or_value):
+        """
+        Stores the value in a free slot and links it before the head.
+
+        If a SSLL_Node is passed as a parameter, its value is stored.
+        """
+        slot = self._take_slot(node_or_value)
+        self._next[slot] = self._head
+
+        if self._head == -1:
+            self._tail = slot
+
+        self._head = slot
+        self._idx += 1
+
+    def insert(self, node_or_value, position):
+        """
+        Stores the value in a free slot and links it in the index position
+        passed as parameter, so it takes the place of the value there.
+
+        'START' and 'END' can be used as position values to specify the
+        start or end of the list respectively.
+        """
+        if type(position) == str:
+
+            if position.lower() == 'end':
+                position = self._idx
+            elif position.lower() == 'start':
+                position = 0
+            else:
+                raise ValueError('Only "start" and "end" are valid string parameters.')
+
+        if position == 0:
+            self.prepend(node_or_value)
+        elif position == self._idx:
+            self.append(node_or_value)
+        else:
+            slot_to_move, slot_behind = self._find_by_index(position)
+
+            if slot_to_move == -1:
+                raise IndexError('Index out of range')
+
+            slot = self._take_slot(node_or_value)
+            self._next[slot] = slot_to_move
+            self._next[slot_behind] = slot
+            self._idx += 1
+
+    def pop(self, idx=None):
+        """
+        Unlinks the value at the index passed as parameter, releases its
+        slot and returns a new SSLL_Node holding the value.
+
+        Defaults to the last value in the list. The head is unlinked 
+        without looking it up by index.
+        """
+        assert self._head != -1, 'List is empty.'
+
+        if idx == 0:
+            slot = self._head
+            self._head = self._next[slot]
+
+            if slot == self._tail:
+                self._tail = -1
+
+            self._idx -= 1
+            return SSLL_Node(self._release_slot(slot))
+
+        if idx == None:
+            idx = self._idx - 1
+
+        slot, slot_behind = self._find_by_index(idx)
+
+        if slot == -1:
+            raise IndexError('Index out of range.')
+
+        if slot == self._head:
+            self._head = self._next[slot]
+        else:
+            self._next[slot_behind] = self._next[slot]
+
+        if slot == self._tail:
+            self._tail = slot_behind
+
+        self._idx -= 1
+        return SSLL_Node(self._release_slot(slot))
+
+    def pprint(self):
+        """
+        Prints the list in index order, one value at a time, and returns
+        the printed text, as SortedSinglyLL.pprint() does.
+        """
+        if self._head == -1:
+            print("Linked list is empty.")
+            return "Linked list is empty."
+
+        lines = [f'Index: {i} - Value: {str(value)}' for i, value in enumerate(self)]
+        rtn = '\n'.join(lines)
+        print(rtn)
+        return rtn
+
+    def split(self, idx):
+        """
+        Splits the list into two halfs, the second one starting from the
+        index passed as a parameter.
+
+        The values of the second half are moved to a new list with a pool
+        of its own, which is returned. Their slots are released in this one.
+        """
+        assert self._head != -1, 'List is empty.'
+        assert idx != 0, \
+            "Cannot split from head node, it must be from the second node onwards."
+
+        slot, slot_behind = self._find_by_index(idx)
+
+        if slot == -1:
+            raise IndexError('Index out of range.')
+
+        second_list = self.__class__(capacity=self._idx - idx)
+        self._next[slot_behind] = -1
+        self._tail = slot_behind
+        self._idx = idx
+
+        while slot != -1:
+            next_slot = self._next[slot]
+            second_list.append(self._release_slot(slot))
+            slot = next_slot
+
+        return second_list
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the list, with a pool just
+        big enough to hold its values.
+        """
+        return self.__class__(*self, capacity=self._idx)
+
+    def _take_slot(self, node_or_value):
+        """
+        Takes the first slot of the free-list or, if it is empty, the first
+        slot that was never used, growing the pool if there are none left.
+
+        Stores the value in it and returns the slot.
+        """
+        slot = self._free
+
+        if slot != -1:
+            self._free = self._next[slot]
+        else:
+            if self._used == self._capacity:
+                self._grow()
+
+            slot = self._used
+            self._used += 1
+
+        self._values[slot] = node_or_value.value if isinstance(node_or_value, SSLL_Node) \
+            else node_or_value
+        self._next[slot] = -1
+        return slot
+
+    def _release_slot(self, slot):
+        """
+        Links the slot at the front of the free-list and returns the value
+        it held, which is replaced by None to release its reference.
+        """
+        value = self._values[slot]
+        self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+        return value
+
+    def _grow(self):
+        """
+        Doubles the capacity of the pool, extending the list of values and
+        the next array with free slots.
+        """
+        self._values.extend([None] * self._capacity)
+        self._next.extend(array('q', [-1]) * self._capacity)
+        self._capacity *= 2
+
+    def _find_by_index(self, idx):
+        """
+        Returns a tuple with the slot at the index passed as parameter and
+        the slot behind it, which is -1 if the index is 0.
+
+        If the index is out of range, it returns -1 and the tail slot.
+        """
+        if type(idx) is not int or not 0 <= idx < self._idx:
+            return -1, self._tail
+
+        next_slots = self._next
+        previous = -1
+        slot = self._head
+
+        for _ in range(idx):
+            previous = slot
+            slot = next_slots[slot]
+
+        return slot, previous
+
+    @staticmethod
+    def _unwrap(node_or_value):
+        """
+        Returns the value of the node passed as parameter, or the
+        parameter itself if it is not a SSLL_Node.
+        """
+        if isinstance(node_or_value, SSLL_Node):
+            return node_or_value.value
+
+        return node_or_value
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    pssll = PooledSortedSinglyLL('Hello', 1, SSLL_Node(True), {'a': 1}, 0.5, [1,False])
+
+    print(pssll)                                    # __str__
+
+    # print(pssll.get_capacity())                     # get_capacity
+    # for i in range(20):                             #
+    #     pssll.append(i)                             #
+    # print(pssll.get_capacity())                     # /get_capacity
+
+    # print(pssll)                                    # pop
+    # print(pssll.pop(1))                             #
+    # print(pssll.pop())                              #
+    # print(pssll)                                    #
+    # pssll.prepend('Reusing a slot')                 #
+    # print(pssll)                                    # /pop
+
+    # print(pssll)                                    # insert
+    # pssll.insert('Squeezing!', 2)                   #
+    # pssll.insert('First', 'START')                  #
+    # pssll.insert('Last', 'END')                     #
+    # print(pssll)                                    # /insert
+
+    # second_half = pssll.split(3)                    # split
+    # print(pssll)                                    #
+    # print(second_half)                              # /split
+
+    # pssll_clone = pssll.clone()                     # clone
+    # print(pssll_clone == pssll)                     #
+    # pssll_clone.append('Not in the original')       #
+    # print(pssll)                                    #
+    # print(pssll_clone)                              # /clone
@@ -1,3 +1,10 @@
+import io
+import pickle
+import struct
+import sys
+from array import array
+
+
 class SortedSinglyLL:
     """
     A class that tries to emulate the behavior of a Singly Sorted linked 
@@ -20,6 +27,51 @@ class SortedSinglyLL:
     when the main program initializes. Uncomment them a block at a time to 
     test them out.
 
+    Positional lookups walk the list from the head. For long lists, pass
+    express_lanes=True to the constructor and the list will keep a
+    reference to every _LANE_STRIDE-th node keyed by its stored index, so
+    any index can be reached walking at most _LANE_STRIDE nodes. Lanes are
+    updated by every method that links, unlinks or reindexes nodes.
+
+    Membership tests and indexOf() compare the repr of every value in the
+    list. Pass value_index=True to the constructor to keep a map from each
+    value to the nodes holding it instead. Hashable values are matched by
+    type and equality, unhashable ones by their repr when they were added.
+    Keep in mind that the map is only updated by the list methods, so
+    values that are changed in place, or by assigning node.value directly,
+    will not be found by their new value.
+
+    The list can also be kept in order by its values instead of by the 
+    order they were inserted in. Pass ordered=True, or a key function 
+    with key=, to the constructor, and use add() to insert each value in
+    its sorted place. The values passed to the constructor are sorted 
+    first. Ordered lists always keep express lanes, which double as their 
+    search index: bisect_left() and bisect_right() binary search the lanes
+    and then walk at most _LANE_STRIDE nodes, so finding where a value goes
+    takes O(log n) comparisons instead of one per node. Methods that take
+    a position (append, prepend, insert, extend, __setitem__...) still 
+    place values where they are told, so they can break the order.
+
+    Each list can also keep a fingerprint of its values: a rolling hash of
+    the strings, integers, bytes, booleans and None it holds, in order.
+    It is computed the first time the list is compared with ==, and from
+    then on, methods that add or remove nodes at either end or assign a 
+    value keep it up to date in constant time, while the ones that 
+    rearrange the middle of the list mark it to be computed again the next
+    time it is needed. This way, == rejects lists that differ in length or 
+    fingerprint without comparing their values one by one, and lists that 
+    are never compared do not pay for it. Just like the value map, it is only
+    updated by the list methods, so do not assign node.value directly on
+    lists you will compare.
+
+    Lists can be saved to binary files with dump() and read back with 
+    load(). Values are pickled one by one into a flat sequence of records,
+    each one prefixed by its length, and followed by a table with the 
+    offset of each record. So, lists of any length can be saved without 
+    reaching the recursion limit that pickling the _next chain would hit,
+    and files can be opened as a MappedSortedSinglyLL (check 
+    mappedSinglyLL.py) to read values without loading them as a list.
+
     Keep in mind that this structure does NOT support adding the same node
     different lists, since each list is indexed by using its nodes _idx 
     individual values. Whenever a new node is added to a linked list, the 
@@ -33,16 +85,41 @@ class SortedSinglyLL:
         self._head : Head reference to first node.
         self._tail : Tail reference to last node.
         self._idx : Index to assign to each node to keep sorted order.
+        self._fingerprint : The rolling hash of the list values, or None
+                      if it must be computed again.
+        self._power : _FP_BASE to the power of the list length, modulo 
+                      _FP_MOD. Only valid while the fingerprint is.
+        self._opaque : True if a value that is not fingerprinted (see 
+                       _fingerprint_of) went into or out of the fingerprint
+                       since it was last computed. Only valid while the 
+                       fingerprint is.
+        self._base : Stored index of the head node. A node's index in the
+                     list is its stored _idx minus this base, which lets
+                     head operations run without reindexing the list.
+        self._lanes : Express lanes. A dictionary mapping the stored index
+                      of every _LANE_STRIDE-th node to that node, or None
+                      if the list was created with express_lanes=False.
+        self._value_map : A dictionary mapping each value key to the set of 
+                      nodes holding that value, or None if the list was
+                      created with value_index=False.
+        self._ordered : True if the list keeps its values in order.
+        self._key : The key function values are ordered by, or None to
+                    order them by the values themselves.
     
     Methods:
         __init__
         __len__
         __str__
-        __iter__
+        __iter__ : Generator that yields each value in the list.
         __contains__
-        __getitem__
+        __getitem__ : Gets the value at an index, or a new list with the 
+                values in a slice.
         __setitem__
         __eq__
+        from_iterable : Class method that creates a list holding all values
+                or nodes in an iterable.
+        load : Class method that creates a list holding the values saved
+                to a binary file by dump().
         get_head : Gets a reference to the head node.
         get_tail : Gets a reference to the tail node.
         get_list_index : Gets the current list index.
@@ -51,47 +128,95 @@ class SortedSinglyLL:
                      each inner tuple is in the format of (node index, node value).
         set_nodes : Sets all nodes to a value. Has a safe overwirte 
                      mode to replace only the nodes whose values are None.
+        map_inplace : Replaces each value with the result of a function.
+        filter_inplace : Keeps only the values a function returns True for,
+                unlinking the rest in one pass.
+        remove_all : Removes every node holding a value in one pass.
+        iter_range : Generator that yields the values from a start index to
+                a stop one, walking the list only once.
+        iter_between : Generator that yields the values whose keys fall
+                between two keys, on ordered lists.
+        add : Inserts a value/node in its sorted place, on ordered lists.
+        bisect_left : Returns the index a value would be added at, before
+                any equal values, on ordered lists.
+        bisect_right : Same as bisect_left, but after any equal values.
         indexOf : Gets the indexes of the node whose values matches with 
                 the parameter.
+        is_empty : Returns True if the head pointer is None.
         valueOf : Gets the value of the node whose index matches with 
                 the parameter.
         clear : Removes all nodes from the list. If the nodes are not bound
                 to an external reference, they will be garbage collected.
         append : Inserts a value/node at the end of the list.
+        extend : Inserts all values/nodes in an iterable at the end of the 
+                list, linking them in one pass.
         prepend : Inserts a value/node at the beginning of the list.
         insert : Inserts a value/node at the given index position.
+        insert_many : Inserts all values/nodes in an iterable starting at the 
+                given index position, reindexing the list at most once.
         pop : Removes the node at the given index. Defaults to self._tail
         dprint : Prints the current list index, the list itself (as in
                   pprint), and the head and tail references with their index,
                   value and next fields. If all_nodes=True, all of the member
                   nodes will be printed out in the same fashion.
         pprint : Prints each node's index and values. A detailed print.
+        render : Writes the list to any text file object in linear time,
+                optionally showing only its first and last N values.
         split : Splits the list in two starting at the given index and 
                 returns a reference to the head of the second list.
         clone : Creates and returns a shallow copy of the linked list.
+        dump : Saves the list values to a binary file in one pass.
         _find_by_value : finds and returns a tuple of tuples with all nodes  
                         whose values match the one passed as a parameter.
                         Inner tuples : (matched_node, previous_neighbor).
         _find_by_index : finds and returns a tuple with the node whose index
                         matches the one passed as a parameter. The tuple
                         will also contain the previous neighbor.          
+        _unlink_head : Unlinks and returns the head node in constant time.
+        _unlink_head_chain : Unlinks the first nodes of the list as one
+                chain and returns its first node.
         _nodify : Takes a value and converts it to a SSLL_Node instace before
                 returning it. If the value is already an instance of that
                 class, it will be returned with no changes.
         _reindex : Beginning from the node passed as a parameter, reindexed
                 each node counting from the integer onwards.
+        _read_records : Generator that reads and unpickles the values saved
+                by dump().
+        _read_exactly : Reads an exact amount of bytes from a file.
+        _index_of_node : Returns the list index of a member node, this is,
+                its stored _idx minus the list base.
+        _link_chain : Nodifies, indexes and links all values in an iterable,
+                returning the first and last nodes and their count.
+        _chain : Generator that yields each node from the one passed as a
+                parameter to the end of the chain.
+        _release_chain : Generator that unlinks and yields each node of a
+                chain detached from the list.
+        _get_fingerprint : Returns the list fingerprint, computing it again
+                if it was marked to be.
+        _fingerprint_of : Returns the hash a value adds to the fingerprint.
+        _options : Returns the constructor keyword arguments needed to
+                create an empty list configured like this one.
+        _adopt : Moves the nodes of a SortedSinglyLL into a new instance
+                of the class of this one, like Stack or Queue.
+        _add_lane : Registers a node in the express lanes if its stored
+                index falls on a lane.
+        _map_value : Adds a node to the value map.
+        _unmap_value : Removes a node from the value map.
+        _value_key : Returns the key a value is stored by in the value map.
+        _sort_key : Returns the key a value or node is ordered by.
+        _bisect_key : Returns the index of the first node whose key is not
+                before the one passed as a parameter.
 
     Classes:
-        _SSLL_Iterator : Inner private class that generates the iterator.
-
         SSLL_Node : Outer public class that creates valid node objects.
                     It is kept public for convenience, when nodes ought to
                     be created before assigning them to the linked list.
 
             Attributes:
                 self._value : The node's value.
-                self._idx : The node's index assigned by the linked list.
-                            Defaults to None.
+                self._idx : The node's stored index assigned by the linked
+                            list. Defaults to None. It matches the list 
+                            index while the list base is 0.
                 self._next : The reference to the next node.
                                 Defaults to None.
 
@@ -106,59 +231,97 @@ class SortedSinglyLL:
     Contact: nmcadierno@hotmail.com
     """         
 
-    def __init__(self, *args):
+    _LANE_STRIDE = 32
+    _FP_BASE = 1000003
+    _FP_MOD = (1 << 61) - 1
+    _FP_INVERSE = pow(_FP_BASE, _FP_MOD - 2, _FP_MOD)
+    _FP_TYPES = (str, int, bytes, bool, type(None))
+    _DUMP_MAGIC = b'SSLL'
+    _DUMP_VERSION = 1
+    _DUMP_HEADER = struct.Struct('<4sBQ')
+    _DUMP_LENGTH = struct.Struct('<Q')
+    _DUMP_OFFSET = struct.Struct('<Q')
+    _DUMP_FOOTER = struct.Struct('<Q4s')
+
+    def __init__(self, *args, express_lanes=False, value_index=False, ordered=False, key=None):
         """ 
         Initializes a list composed SSLL_Node objects with the values
         passed as args in that order. Assigns an index to each of them
         and links them by their _next field.
         
         If no args are supplied, the instance will be empty.
+
+        If express_lanes=True, the list keeps an express lane every 
+        _LANE_STRIDE nodes to speed up lookups by index.
+
+        If value_index=True, the list keeps a map from values to nodes
+        to speed up membership tests and indexOf().
+
+        If ordered=True or a key function is passed, the args are sorted
+        by their values (or by key(value)) and the list keeps express
+        lanes to add() values in order.
         """
+        self._ordered = ordered or key is not None
+        self._key = key
+
+        if self._ordered:
+            express_lanes = True
+
         self._idx = 0
+        self._base = 0
         self._head = None
         self._tail = None
+        self._lanes = {} if express_lanes else None
+        self._value_map = {} if value_index else None
+        self._fingerprint = None
+        self._power = 1
+        self._opaque = False
 
         if args:
-            first = self._nodify(args[0])
-            first._idx = self._idx
-            self._idx +=1
-            self._head = first
-            self._tail = first
-
-            for arg in args[1:]:
-                node = self._nodify(arg)
-                node._idx = self._idx
-                self._idx += 1
-                self._tail._next = node
-                self._tail = node
+            self.extend(sorted(args, key=self._sort_key) if self._ordered else args)
 
     def __len__(self):
         return self._idx
 
     def __str__(self, start=">> ", end=" >/>", separator='->'):
+        rtn = io.StringIO()
+        self.render(rtn, start=start, end=end, separator=separator)
+        return rtn.getvalue()
+
+    def __iter__(self):
         current = self._head
-        rtn = start
 
         while current:
-
-            if not current._next:
-                rtn += f'{current}'
-                break
-
-            rtn += f'{current} {separator} '
+            yield current.value
             current = current._next
 
-        rtn += end
-        return rtn
-
-    def __iter__(self):
-        return self._SSLL_Iterator(self._head)
-
     def __contains__(self, node):
+        if self._value_map is not None:
+            value = node.value if isinstance(node, SSLL_Node) else node
+            return bool(self._value_map.get(self._value_key(value)))
+
         result = self._find_by_value(node)
         return True if result[0][0] else False
 
     def __getitem__(self, idx):
+        if type(idx) is slice:
+            start, stop, step = idx.indices(len(self))
+
+            options = self._options()
+
+            if step > 0:
+                values = self.iter_range(start, stop, step)
+            else:
+                values = list(self.iter_range(stop + 1, start + 1))[::step]
+
+                # Reversed values are no longer in key order.
+                options['ordered'] = False
+                options['key'] = None
+
+            new_list = SortedSinglyLL(**options)
+            new_list.extend(values)
+            return new_list
+
         result = self._find_by_index(idx)
 
         if result[0]:
@@ -170,20 +333,36 @@ class SortedSinglyLL:
         result = self._find_by_index(idx)
 
         if result[0] == self._tail and isinstance(value, SSLL_Node):
-            self.pop(result[0]._idx)
+            self.pop(idx)
             self.insert(value, 'end')
         elif result[0] and isinstance(value, SSLL_Node):
-            temp = result[0]._idx
-            self.pop(result[0]._idx)
-            self.insert(value, temp)
+            self.pop(idx)
+            self.insert(value, idx)
         elif result[0]:
-            result[0].value = value
+            if self._fingerprint is not None:
+                self._fingerprint = (self._fingerprint + 
+                    (self._fingerprint_of(value) - self._fingerprint_of(result[0].value)) * 
+                    pow(self._FP_BASE, idx, self._FP_MOD)) % self._FP_MOD
+
+            if self._value_map is not None:
+                self._unmap_value(result[0])
+                result[0].value = value
+                self._map_value(result[0])
+            else:
+                result[0].value = value
         else:
             raise IndexError('Index out of range.')
 
     def __eq__(self, ssll):
         assert isinstance(ssll, SortedSinglyLL), \
             "Both instances must be type SortedSinglyLL to compare."
+
+        if len(self) != len(ssll):
+            return False
+
+        if self._get_fingerprint() != ssll._get_fingerprint() and \
+            not self._opaque and not ssll._opaque:
+            return False
  
         current_one = self._head
         current_two = ssll._head
@@ -199,6 +378,51 @@ class SortedSinglyLL:
         
         return True
 
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Creates and returns a list holding the values or nodes in the
+        iterable passed as parameter, in that order. 
+        
+        kwargs are passed to the constructor, so express_lanes,
+        value_index, ordered or key can be set here too. Ordered lists
+        sort the values first.
+        """
+        new_list = cls(**kwargs)
+
+        if new_list._ordered:
+            iterable = sorted(iterable, key=new_list._sort_key)
+
+        new_list.extend(iterable)
+        return new_list
+
+    @classmethod
+    def load(cls, fp, **kwargs):
+        """
+        Creates and returns a list holding the values saved by dump() to 
+        the binary file object passed as parameter, reading it in one 
+        pass from its current position. Children classes, like Stack or
+        Queue, load instances of themselves.
+
+        kwargs are passed to the constructor, as in from_iterable(). The
+        values are unpickled, so only load files you trust.
+        """
+        magic, version, count = cls._DUMP_HEADER.unpack(cls._read_exactly(fp, cls._DUMP_HEADER.size))
+
+        if magic != cls._DUMP_MAGIC or version != cls._DUMP_VERSION:
+            raise ValueError('Not a list dump, or a dump of another version.')
+
+        new_list = cls(**kwargs)
+        new_list.extend(cls._read_records(fp, count))
+
+        cls._read_exactly(fp, count * cls._DUMP_OFFSET.size)
+        _, magic = cls._DUMP_FOOTER.unpack(cls._read_exactly(fp, cls._DUMP_FOOTER.size))
+
+        if magic != cls._DUMP_MAGIC:
+            raise ValueError('The dump is corrupted.')
+
+        return new_list
+
     def get_head(self):
         """ 
         Returns a reference to the head node.
@@ -227,18 +451,11 @@ class SortedSinglyLL:
         If indexed=False, the each node inside the returned tuple will
         consist have a reference to its value.
         """
-        nodes = []
-        current = self._head
+        if kwargs.get('indexed') == True:
+            base = self._base
+            return tuple([(node._idx - base, node.value) for node in self._chain(self._head)])
 
-        while current:
-            if 'indexed' in kwargs.keys():
-                if kwargs['indexed'] == True:
-                    nodes.append((current._idx, current.value))
-            else:
-                nodes.append(current.value)
-            current = current._next
-
-        return tuple(nodes)
+        return tuple(self)
 
     def set_nodes(self, value, **kwargs):
         """ 
@@ -248,35 +465,238 @@ class SortedSinglyLL:
         
         If overwrite=False, only values=None will be changed.
         """
+        overwrite = kwargs.get('overwrite', False)
+
+        if overwrite == True:
+            self.map_inplace(lambda current: value)
+        elif overwrite == False:
+            self.map_inplace(lambda current: value if current == None else current)
+
+    def map_inplace(self, fn):
+        """
+        Replaces the value of each node with the result of calling the 
+        function passed as parameter with it, in a single pass. Nodes are
+        kept as they are, so nothing is reindexed.
+
+        On ordered lists, the function must keep the values in order.
+        """
+        self._fingerprint = None
         current = self._head
 
+        if self._value_map is None:
+            while current:
+                current.value = fn(current.value)
+                current = current._next
+
+            return
+
+        self._value_map.clear()
+
         while current:
+            current.value = fn(current.value)
+            self._map_value(current)
+            current = current._next
 
-            if 'overwrite' in kwargs.keys():
+    def filter_inplace(self, pred):
+        """
+        Keeps only the nodes whose values make the function passed as 
+        parameter return True, and returns how many nodes were removed.
 
-                if kwargs['overwrite'] == True:
-                    current.value = value 
-                elif kwargs['overwrite'] == False and current.value == None:
-                    current.value = value
+        The rest are unlinked in a single pass, just like pop() would
+        leave them, and the nodes after the first removed one are 
+        reindexed once at the end, instead of once per removal.
 
-            elif 'overwrite' not in kwargs.keys() and current.value == None:
-                current.value = value
+        The function is called on every value before any node is unlinked,
+        so if it raises an error, the list is left untouched.
+        """
+        kept = []
+        current = self._head
 
+        while current:
+            kept.append(pred(current.value))
             current = current._next
 
+        removed = 0
+        first_removed = None
+        first_moved = None
+        head = None
+        previous = None
+        current = self._head
+
+        for keep in kept:
+            following = current._next
+
+            if keep:
+                if previous is None:
+                    head = current
+                else:
+                    previous._next = current
+
+                if first_removed is not None and first_moved is None:
+                    first_moved = current
+
+                previous = current
+            else:
+                if first_removed is None:
+                    first_removed = current._idx
+
+                if self._value_map is not None:
+                    self._unmap_value(current)
+
+                current._idx = None
+                current._next = None
+                removed += 1
+
+            current = following
+
+        if not removed:
+            return 0
+
+        if head is None:
+            self.clear()
+            return removed
+
+        old_end = self._base + self._idx
+        previous._next = None
+        self._head = head
+        self._tail = previous
+        self._idx -= removed
+        self._fingerprint = None
+
+        if first_moved:
+            self._reindex(first_moved, first_removed)
+
+        if self._lanes is not None:
+            stride = self._LANE_STRIDE
+            new_end = self._base + self._idx
+
+            for lane in range(new_end + (-new_end) % stride, old_end, stride):
+                self._lanes.pop(lane, None)
+
+        return removed
+
+    def remove_all(self, node_or_value):
+        """
+        Removes every node whose value's repr matches the one of the value
+        or node's value passed as parameter, in a single pass (check 
+        filter_inplace), and returns how many nodes were removed.
+        """
+        value = node_or_value.value if isinstance(node_or_value, SSLL_Node) \
+            else node_or_value
+
+        if self._value_map is not None and not self._value_map.get(self._value_key(value)):
+            return 0
+
+        target = repr(value)
+        return self.filter_inplace(lambda current: repr(current) != target)
+
+    def iter_range(self, start=0, stop=None, step=1):
+        """
+        Generator that yields the values from the start index (included) 
+        to the stop one (excluded), every step values. Negative indexes
+        count from the end of the list, as in Python lists.
+
+        The first value is looked up by index (taking advantage of the 
+        express lanes, if any) and from there on the list is walked only 
+        once, so reading k values costs k steps instead of k lookups.
+        Since the list is singly linked, step must be positive.
+        """
+        if step <= 0:
+            raise ValueError('Step must be a positive integer.')
+
+        start, stop, step = slice(start, stop, step).indices(len(self))
+
+        if start >= stop:
+            return
+
+        current = self._find_by_index(start)[0]
+
+        for _ in range((stop - start - 1) // step):
+            yield current.value
+
+            for _ in range(step):
+                current = current._next
+
+        yield current.value
+
+    def iter_between(self, low=None, high=None, inclusive=(True, True)):
+        """
+        Generator that yields, in order, the values of an ordered list 
+        whose keys fall between the low and high keys passed as 
+        parameters. If low or high are None, the range is open on that 
+        side. inclusive sets whether each end is included in the range.
+
+        Both ends are found with _bisect_key, so only the values in the 
+        range are walked once they are.
+        """
+        assert self._ordered, 'Only ordered lists can be iterated by key.'
+
+        start = 0 if low is None else self._bisect_key(low, not inclusive[0])
+        stop = self._idx if high is None else self._bisect_key(high, inclusive[1])
+
+        yield from self.iter_range(start, max(start, stop))
+
+    def add(self, node_or_value):
+        """
+        Inserts the value or node passed as parameter in its sorted place
+        of an ordered list, after any values with an equal key, and 
+        returns the index it was inserted at.
+        """
+        assert self._ordered, 'Only ordered lists can add values in order.'
+
+        idx = self._bisect_key(self._sort_key(node_or_value), True)
+        self.insert(node_or_value, idx)
+        return idx
+
+    def bisect_left(self, node_or_value):
+        """
+        Returns the index where the value or node passed as parameter 
+        would be added in an ordered list, before any values whose key is
+        equal to its own.
+        """
+        assert self._ordered, 'Only ordered lists can be bisected.'
+
+        return self._bisect_key(self._sort_key(node_or_value), False)
+
+    def bisect_right(self, node_or_value):
+        """
+        Returns the index where the value or node passed as parameter 
+        would be added in an ordered list, after any values whose key is
+        equal to its own.
+        """
+        assert self._ordered, 'Only ordered lists can be bisected.'
+
+        return self._bisect_key(self._sort_key(node_or_value), True)
+
     def indexOf(self, node_or_value):
         """ 
         Returns a tuple containing the indexes of the nodes whose 
         values match the value or the node's value passed as the 
         parameter. 
         """
+        if self._value_map is not None:
+            value = node_or_value.value if isinstance(node_or_value, SSLL_Node) \
+                else node_or_value
+            nodes = self._value_map.get(self._value_key(value))
+
+            if nodes:
+                return tuple(sorted([node._idx - self._base for node in nodes]))
+            else:
+                raise ValueError('Value not in list.')
+
         result = self._find_by_value(node_or_value)
 
         if result[0][0]:
-            return tuple([result[i][0]._idx for i in range(len(result))])
+            return tuple([result[i][0]._idx - self._base for i in range(len(result))])
         else:
             raise ValueError('Value not in list.')
 
+    def is_empty(self):
+        """
+        Returns True if the head pointer is None.
+        """
+        return self._head is None
+
     def valueOf(self, idx):
         """ 
         Returns the value of the index passed as parameter. 
@@ -296,6 +716,16 @@ class SortedSinglyLL:
         self._head = None
         self._tail = None
         self._idx = 0
+        self._base = 0
+        self._fingerprint = None
+        self._power = 1
+        self._opaque = False
+
+        if self._lanes is not None:
+            self._lanes.clear()
+
+        if self._value_map is not None:
+            self._value_map.clear()
 
     def append(self, node_or_value):
         """ 
@@ -306,7 +736,7 @@ class SortedSinglyLL:
         from it and is submitted to the process described above.
         """
         node = self._nodify(node_or_value)
-        node._idx = self._idx
+        node._idx = self._base + self._idx
         self._idx += 1
 
         if not self._head:
@@ -316,23 +746,78 @@ class SortedSinglyLL:
             self._tail._next = node
             self._tail = node
 
+        if self._fingerprint is not None:
+            value = node.value
+
+            if type(value) in self._FP_TYPES:
+                self._fingerprint = (self._fingerprint + hash(value) * self._power) % self._FP_MOD
+            else:
+                self._opaque = True
+
+            self._power = self._power * self._FP_BASE % self._FP_MOD
+
+        if self._lanes is not None:
+            self._add_lane(node)
+
+        if self._value_map is not None:
+            self._map_value(node)
+
+    def extend(self, iterable):
+        """
+        Appends all values or nodes in the iterable passed as parameter to
+        the end of the list, in that order.
+
+        The new nodes are linked to each other in a single pass and then
+        attached to the tail, instead of appending them one at a time.
+        """
+        head, tail, count = self._link_chain(iterable, self._base + self._idx)
+
+        if not head:
+            return
+
+        if not self._head:
+            self._head = head
+        else:
+            self._tail._next = head
+
+        self._tail = tail
+        self._idx += count
+        self._fingerprint = None
+
     def prepend(self, node_or_value):
         """ 
         Appends a node in front of the list, assigns index 0 to it, links
-        it to the former first node, moves the head to point to this new node
-        and reindexes the whole list. 
+        it to the former first node and moves the head to point to this new 
+        node. 
+
+        Instead of reindexing the whole list, the list base is moved one
+        step back and the new node takes it as its stored index, so the
+        rest of the nodes shift one position without being visited.
 
         If a value is passed as a parameter instead, a SSLL_Node object is created
         from it and is submitted to the process described above.
         """
         node = self._nodify(node_or_value)
-        node._idx = 0
         node._next = self._head
         if not self._head:
             self._tail = node
+            self._base = 0
+        else:
+            self._base -= 1
+        node._idx = self._base
         self._head = node
         self._idx += 1
-        self._reindex(node, 0)
+
+        if self._fingerprint is not None:
+            self._fingerprint = (self._fingerprint * self._FP_BASE + 
+                self._fingerprint_of(node.value)) % self._FP_MOD
+            self._power = self._power * self._FP_BASE % self._FP_MOD
+
+        if self._lanes is not None:
+            self._add_lane(node)
+
+        if self._value_map is not None:
+            self._map_value(node)
 
     def insert(self, node_or_value, position): 
         """ 
@@ -345,7 +830,8 @@ class SortedSinglyLL:
         start or end of the list respectively.
 
         After the insertion, from this new node onwards, the list is 
-        reindexed, and self._idx is adjusted accordingly.
+        reindexed, and self._idx is adjusted accordingly. Insertions at
+        the front are delegated to prepend(), which does not reindex.
 
         If a value is passed as a parameter instead, a SSLL_Node object is created
         from it and is submitted to the process described above.
@@ -353,7 +839,7 @@ class SortedSinglyLL:
         if type(position) == str:
 
             if position.lower() == 'end': 
-                position = self._tail._idx + 1
+                position = self._idx
             elif position.lower() == 'start':
                 position = 0
             else:
@@ -364,37 +850,87 @@ class SortedSinglyLL:
         if not node_to_move and not node_behind:
 
             if position == 0 and not self._head:
-                node = self._nodify(node_or_value)
-                node._idx = self._idx
-                self._head = node
-                self._tail = node
-                self._idx += 1
+                self.prepend(node_or_value)
                 return
             else:
                 raise IndexError('Index out of range')
 
         node = self._nodify(node_or_value)
 
-        if not node_to_move and node_behind and position == self._tail._idx +1:
-            node_behind._next = node
-            self._tail = node
-            node._idx = self._idx
-            self._idx += 1
+        if not node_to_move and node_behind and position == self._idx:
             node._next = None
+            self.append(node)
         else:
-            assert position <= self._tail._idx, \
+            assert position < self._idx, \
                 "Index out of range."
 
+            if node_to_move is self._head:
+                self.prepend(node)
+                return
+
             new_node_idx = node_to_move._idx
             node._next = node_to_move
+            node_behind._next = node
+            self._idx += 1
+            self._fingerprint = None
+            self._reindex(node, new_node_idx)
 
-            if node_to_move is self._head:
-                self._head = node
+            if self._value_map is not None:
+                self._map_value(node)
+
+    def insert_many(self, position, iterable):
+        """
+        Inserts all values or nodes in the iterable passed as parameter
+        starting at the specified index position, in that order. That is,
+        the first of them will take that index, and the node that was
+        there will follow the last of them.
+
+        'START' and 'END' can be used as position values to specify the 
+        start or end of the list respectively.
+
+        The new nodes are linked in a single pass. Insertions at the start
+        only move the list base, insertions at the end do not reindex, and
+        any other one reindexes the nodes after the new ones only once.
+        """
+        if type(position) == str:
+
+            if position.lower() == 'end': 
+                position = self._idx
+            elif position.lower() == 'start':
+                position = 0
             else:
-                node_behind._next = node
+                raise ValueError('Only "start" and "end" are valid string parameters.')
 
-            self._idx += 1
-            self._reindex(node, new_node_idx)
+        if position == self._idx:
+            self.extend(iterable)
+            return
+
+        node_to_move, node_behind = self._find_by_index(position)
+
+        if not node_to_move:
+            raise IndexError('Index out of range')
+
+        if not isinstance(iterable, (list, tuple)):
+            iterable = list(iterable)
+
+        if node_to_move is self._head:
+            head, tail, count = self._link_chain(iterable, self._base - len(iterable))
+        else:
+            head, tail, count = self._link_chain(iterable, node_to_move._idx)
+
+        if not head:
+            return
+
+        tail._next = node_to_move
+        self._idx += count
+        self._fingerprint = None
+
+        if node_to_move is self._head:
+            self._head = head
+            self._base -= count
+        else:
+            node_behind._next = head
+            self._reindex(node_to_move, tail._idx + 1)
 
     def pop(self, idx=None):
         """ 
@@ -405,15 +941,19 @@ class SortedSinglyLL:
         a reference to that unlinked node.
          
         If the node to be removed is the head, then the _head reference
-        is adjusted to point to it. If it is the tail node, then the _tail
+        is adjusted to point to it and the list base moves one step forward,
+        so no reindexing is needed. If it is the tail node, then the _tail
         reference is moved to point towards its predecessor.
 
         self._idx is adjusted accordingly.
         """
         assert self._head, 'List is empty.'
 
+        if idx == 0:
+            return self._unlink_head()
+
         if idx == None:
-            idx = self._tail._idx
+            idx = self._idx - 1
 
         node_to_remove, node_behind = self._find_by_index(idx)
 
@@ -422,17 +962,39 @@ class SortedSinglyLL:
 
         rtn = node_to_remove
 
+        if self._lanes is not None:
+            if node_to_remove is self._head or node_to_remove is self._tail:
+                self._lanes.pop(node_to_remove._idx, None)
+            else:
+                self._lanes.pop(self._tail._idx, None)
+
+        if self._value_map is not None:
+            self._unmap_value(node_to_remove)
+
         if not self._head._next:
             self._head = None
             self._tail = None
+            self._base = 0
+            self._fingerprint = None
         elif node_to_remove is self._head:
             self._head = node_to_remove._next
-            self._reindex(self._head, 0)
+            self._base += 1
+
+            if self._fingerprint is not None:
+                self._fingerprint = (self._fingerprint - self._fingerprint_of(rtn.value)) * \
+                    self._FP_INVERSE % self._FP_MOD
+                self._power = self._power * self._FP_INVERSE % self._FP_MOD
         elif node_to_remove is self._tail:
             self._tail = node_behind
             node_behind._next = None
+
+            if self._fingerprint is not None:
+                self._power = self._power * self._FP_INVERSE % self._FP_MOD
+                self._fingerprint = (self._fingerprint - 
+                    self._fingerprint_of(rtn.value) * self._power) % self._FP_MOD
         else:
             node_behind._next = node_behind._next._next
+            self._fingerprint = None
             self._reindex(node_behind._next, node_to_remove._idx)
 
         self._idx -= 1
@@ -447,6 +1009,9 @@ class SortedSinglyLL:
 
         If print_all_nodes=True, each node reference will be printed in detail, 
         not only the ones mentioned above.
+
+        If limit is given, the list itself is streamed to the standard 
+        output by render(), only showing its first and last limit values.
         """
         print('*** Detailed linked list display ***', '\n')
         print("List current index:", self._idx)
@@ -454,7 +1019,7 @@ class SortedSinglyLL:
         if not self._head:
             print("Head pointer is null.")
         else:
-            print("> Head: idx", self._head.get_index(), "- Value:", self._head.get_value(), \
+            print("> Head: idx", self._index_of_node(self._head), "- Value:", self._head.get_value(), \
                 "- Next:", self._head.get_next())
 
         if 'all_nodes' in kwargs.keys():
@@ -466,45 +1031,95 @@ class SortedSinglyLL:
                     current = self._head._next
 
                     while current and current is not self._tail:
-                        print("- Node: idx", current.get_index(), "- Value:", current.get_value(), \
+                        print("- Node: idx", self._index_of_node(current), "- Value:", current.get_value(), \
                             "- Next:", current.get_next())
                         current = current._next
 
         if not self._tail:
             print("Tail pointer is null.")
         else:
-            print("< Tail: idx", self._tail.get_index(), "- Value:", self._tail.get_value(), \
+            print("< Tail: idx", self._index_of_node(self._tail), "- Value:", self._tail.get_value(), \
                 "- Next:", self._tail.get_next())
         
         print('\n', '*** Lazy linked list display ***')
-        print(self)
+
+        if kwargs.get('limit') is None:
+            print(self)
+        else:
+            self.render(sys.stdout, limit=kwargs['limit'])
+            print()
+
         print('-' * 80, end='\n')
 
-    def pprint(self):
+    def pprint(self, limit=None):
         """ 
         Prints the list in a horizontal fashion and index order, one object
-        at a time.
-        """
-        current = self._head
+        at a time, and returns the printed text.
 
-        if not current:
+        If limit is given, only the first and last limit values are printed.
+        """
+        if not self._head:
             print("Linked list is empty.")
             return "Linked list is empty."
 
-        rtn = ""
+        rtn = io.StringIO()
+        self.render(rtn, limit=limit, indexed=True)
+        rtn = rtn.getvalue()[:-1]
+        print(rtn)
+        return rtn
 
-        while current:
+    def render(self, fp, limit=None, indexed=False, start=">> ", end=" >/>", separator='->'):
+        """
+        Writes the list to fp, which can be any text file object (like an
+        open file, sys.stdout or an io.StringIO), one value at a time. 
+        This way, rendering takes linear time and the whole text is never
+        held in memory.
+
+        By default, the list is written as in print(self), using start, 
+        end and separator. If indexed=True, each value is written in its
+        own line along with its index instead, as in pprint().
+
+        If limit is given and the list holds more than twice that many
+        values, only the first and last limit values are written, with 
+        '...' standing for the ones in between.
+        """
+        length = len(self)
 
-            if not current._next:
-                print(f'Index: {current._idx} - Value: {str(current.value)}')
-                rtn += f'Index: {current._idx} - Value: {str(current.value)}'
-                break
+        if limit is not None and length > 2 * limit:
+            sections = ((0, self.iter_range(0, limit)), 
+                        (length - limit, self.iter_range(length - limit)))
+        else:
+            sections = ((0, iter(self)),)
 
-            print(f'Index: {current._idx} - Value: {str(current.value)}')
-            rtn += f'Index: {current._idx} - Value: {str(current.value)}'
-            current = current._next
+        write = fp.write
 
-        return rtn
+        if indexed:
+            for i, (offset, values) in enumerate(sections):
+                if i:
+                    write('...\n')
+
+                for idx, value in enumerate(values, offset):
+                    write(f'Index: {idx} - Value: {value}\n')
+
+            return
+
+        separator = f' {separator} '
+        first = True
+        write(start)
+
+        for i, (offset, values) in enumerate(sections):
+            if i:
+                write('...' if first else separator + '...')
+                first = False
+
+            for value in values:
+                if first:
+                    write(str(value))
+                    first = False
+                else:
+                    write(f'{separator}{value}')
+
+        write(end)
 
     def split(self, idx):
         """ 
@@ -520,10 +1135,16 @@ class SortedSinglyLL:
 
         Returns a new SortedSinglyLL object composed of all nodes in the 
         second half of the list, with its own head and tail references.
+
+        The second half is not copied nor reindexed: the new list adopts
+        the detached chain as it is, taking the stored index of its first
+        node as its base. So, splitting only costs the walk to the split
+        point (plus moving the express lanes and value map entries of the
+        second half, if the list keeps them).
         """
         assert self._head, 'List is empty.'
 
-        assert idx is not self._head._idx, \
+        assert idx != 0, \
             "Cannot split from head node, it must be from the second node onwards."
 
         node_to_split, node_behind = self._find_by_index(idx)
@@ -531,17 +1152,29 @@ class SortedSinglyLL:
         if not node_to_split:
             raise IndexError('Index out of range.')
 
+        second_list = SortedSinglyLL(**self._options())
+        second_list._head = node_to_split
+        second_list._tail = self._tail
+        second_list._base = node_to_split._idx
+        second_list._idx = self._idx - idx
+
         self._tail = node_behind
         self._tail._next = None
-        self._idx = node_behind._idx + 1
+        self._idx = idx
+        self._fingerprint = None
+        second_list._fingerprint = None
 
-        second_head = node_to_split
-        second_list = SortedSinglyLL(second_head)
-        second_node_in_new_list = second_head._next
+        if self._lanes is not None:
+            stride = self._LANE_STRIDE
+            first_lane = second_list._base + (-second_list._base) % stride
 
-        while second_node_in_new_list:
-            second_list.append(second_node_in_new_list)
-            second_node_in_new_list = second_node_in_new_list._next
+            for lane in range(first_lane, second_list._tail._idx + 1, stride):
+                second_list._lanes[lane] = self._lanes.pop(lane)
+
+        if self._value_map is not None:
+            for node in self._chain(node_to_split):
+                self._unmap_value(node)
+                second_list._map_value(node)
 
         return second_list
 
@@ -551,16 +1184,149 @@ class SortedSinglyLL:
         """
         assert self._head, 'Cannot clone an empty list.'
         
-        clone = SortedSinglyLL()
-        current = self._head
-        
-        while current:
-            node = SSLL_Node(current.get_value())
-            clone.append(node)
-            current = current._next
-
+        clone = SortedSinglyLL(**self._options())
+        clone.extend(self)
         return clone
 
+    def dump(self, fp):
+        """
+        Saves the list values to the binary file object passed as 
+        parameter, walking the list once. The file holds, in order:
+
+            A header with b'SSLL', the format version and the amount of
+            values, as little-endian integers.
+            One record per value: its length in bytes followed by the 
+            value pickled on its own.
+            A table with the offset of each record, counting from the 
+            start of the header, so any of them can be read without 
+            reading the ones before it.
+            A footer with the offset of the table and b'SSLL' again.
+
+        Only values are saved, not nodes, and load() links new ones.
+        """
+        header, length, footer = self._DUMP_HEADER, self._DUMP_LENGTH, self._DUMP_FOOTER
+        offsets = array('Q')
+        offset = header.size
+        write = fp.write
+
+        write(header.pack(self._DUMP_MAGIC, self._DUMP_VERSION, self._idx))
+
+        for value in self:
+            record = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            offsets.append(offset)
+            write(length.pack(len(record)))
+            write(record)
+            offset += length.size + len(record)
+
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+
+        write(offsets.tobytes())
+        write(footer.pack(offset, self._DUMP_MAGIC))
+
+
+    def _unlink_head(self):
+        """
+        Unlinks and returns the head node in constant time, moving the
+        list base one step forward, without looking the node up by index
+        as pop() does. Stack.pop() and Queue.dequeue() are built on it.
+        """
+        assert self._head, 'List is empty.'
+
+        node = self._head
+
+        if self._lanes is not None:
+            self._lanes.pop(node._idx, None)
+
+        if self._value_map is not None:
+            self._unmap_value(node)
+
+        if node._next is None:
+            self._head = None
+            self._tail = None
+            self._base = 0
+            self._fingerprint = None
+        else:
+            self._head = node._next
+            self._base += 1
+
+            if self._fingerprint is not None:
+                self._fingerprint = (self._fingerprint - self._fingerprint_of(node.value)) * \
+                    self._FP_INVERSE % self._FP_MOD
+                self._power = self._power * self._FP_INVERSE % self._FP_MOD
+
+        self._idx -= 1
+        node._idx = None
+        node._next = None
+        return node
+
+    def _unlink_head_chain(self, count):
+        """
+        Unlinks the first count nodes of the list (all of them if count is
+        greater than the list length) and returns the first one, still
+        linked to the rest of the detached chain. The last node's _next is
+        None, and the nodes keep their stored indexes.
+
+        The list base is moved forward once for the whole chain, and the 
+        fingerprint is updated with the values of the chain, so only the
+        unlinked nodes are visited. Stack.pop_many() and 
+        Queue.dequeue_many() are built on it.
+        """
+        assert self._head, 'List is empty.'
+        assert type(count) is int and count > 0, \
+            'Count must be an integer greater than 0.'
+
+        head = self._head
+
+        if count >= self._idx:
+            self._head = None
+            self._tail = None
+            self._idx = 0
+            self._base = 0
+            self._fingerprint = None
+            self._power = 1
+
+            if self._lanes is not None:
+                self._lanes.clear()
+
+            if self._value_map is not None:
+                self._value_map.clear()
+
+            return head
+
+        removed = 0
+        power = 1
+        last = head
+
+        for _ in range(count - 1):
+            last = last._next
+
+        if self._lanes is not None or self._value_map is not None or self._fingerprint is not None:
+            for node in self._chain(head):
+                if self._lanes is not None:
+                    self._lanes.pop(node._idx, None)
+
+                if self._value_map is not None:
+                    self._unmap_value(node)
+
+                if self._fingerprint is not None:
+                    removed = (removed + self._fingerprint_of(node.value) * power) % self._FP_MOD
+                    power = power * self._FP_BASE % self._FP_MOD
+
+                if node is last:
+                    break
+
+        self._head = last._next
+        last._next = None
+        self._base += count
+        self._idx -= count
+
+        if self._fingerprint is not None:
+            inverse = pow(self._FP_INVERSE, count, self._FP_MOD)
+            self._fingerprint = (self._fingerprint - removed) * inverse % self._FP_MOD
+            self._power = self._power * inverse % self._FP_MOD
+
+        return head
 
     def _nodify(self, node):
         """ 
@@ -577,12 +1343,299 @@ class SortedSinglyLL:
         """ 
         Reassigns the index values of all linked objects starting
         from starting_node, and counting from idx onwards.
+
+        If the list has express lanes, they are updated on the way.
         """
+        if self._lanes is not None:
+            stride = self._LANE_STRIDE
+
+            while starting_node:
+                starting_node._idx = idx
+
+                if idx % stride == 0:
+                    self._lanes[idx] = starting_node
+
+                idx += 1
+                starting_node = starting_node._next
+
+            return
+
         while starting_node:
             starting_node._idx = idx
             idx += 1
             starting_node = starting_node._next
 
+    def _options(self):
+        """
+        Returns a dictionary with the constructor keyword arguments
+        needed to create an empty list configured like this one.
+        """
+        return {
+            'express_lanes': self._lanes is not None,
+            'value_index': self._value_map is not None,
+            'ordered': self._ordered,
+            'key': self._key
+        }
+
+    def _adopt(self, ssll):
+        """
+        Returns a new instance of this class holding the nodes, express
+        lanes, value map and fingerprint of the SortedSinglyLL passed as
+        parameter, which must not be used afterwards.
+        """
+        new_list = self.__class__(**self._options())
+
+        for name in ('_head', '_tail', '_idx', '_base', '_lanes', '_value_map',
+                     '_fingerprint', '_power', '_opaque'):
+            setattr(new_list, name, getattr(ssll, name))
+
+        return new_list
+
+    def _add_lane(self, node):
+        """
+        Registers the node in the express lanes if its stored index
+        falls on a lane.
+        """
+        if node._idx % self._LANE_STRIDE == 0:
+            self._lanes[node._idx] = node
+
+    def _map_value(self, node):
+        """
+        Adds the node to the set of nodes stored under its value's key.
+        """
+        key = self._value_key(node.value)
+        nodes = self._value_map.get(key)
+
+        if nodes is None:
+            self._value_map[key] = {node}
+        else:
+            nodes.add(node)
+
+    def _unmap_value(self, node):
+        """
+        Removes the node from the set of nodes stored under its value's 
+        key, dropping the key if no nodes are left.
+
+        If the value was changed in place since it was mapped, its key
+        no longer leads to the node, so the whole map is searched.
+        """
+        key = self._value_key(node.value)
+        nodes = self._value_map.get(key)
+
+        if nodes is None or node not in nodes:
+            for key, nodes in self._value_map.items():
+                if node in nodes:
+                    break
+            else:
+                return
+
+        nodes.discard(node)
+
+        if not nodes:
+            del self._value_map[key]
+
+    @staticmethod
+    def _value_key(value):
+        """
+        Returns the key a value is stored by in the value map: its type
+        and the value itself if it is hashable, or its type and its repr
+        otherwise.
+        """
+        try:
+            hash(value)
+            return (type(value), value)
+        except TypeError:
+            return (type(value), repr(value))
+
+    def _sort_key(self, node_or_value):
+        """
+        Returns the key the value or node's value passed as parameter is
+        ordered by: key(value) if the list has a key function, or the 
+        value itself otherwise.
+        """
+        value = node_or_value.value if isinstance(node_or_value, SSLL_Node) \
+            else node_or_value
+
+        return value if self._key is None else self._key(value)
+
+    def _bisect_key(self, key, right=False):
+        """
+        Returns the index of the first node whose key is greater than or 
+        equal to the key passed as parameter, or strictly greater if 
+        right=True. That is, the index where that key would be inserted.
+
+        The express lanes are binary searched for the last lane before 
+        the key, and the list is walked from there, so it takes at most 
+        O(log n) + _LANE_STRIDE comparisons.
+        """
+        stride = self._LANE_STRIDE
+        sort_key = self._sort_key
+
+        if right:
+            before = lambda node: not key < sort_key(node)
+        else:
+            before = lambda node: sort_key(node) < key
+
+        first = self._base + (-self._base) % stride
+        low, high = 0, max(0, (self._base + self._idx - first + stride - 1) // stride)
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if before(self._lanes[first + middle * stride]):
+                low = middle + 1
+            else:
+                high = middle
+
+        if low:
+            current = self._lanes[first + (low - 1) * stride]
+            idx = current._idx - self._base
+        else:
+            current = self._head
+            idx = 0
+
+        while current and before(current):
+            current = current._next
+            idx += 1
+
+        return idx
+
+    @classmethod
+    def _read_records(cls, fp, count):
+        """
+        Generator that reads count records saved by dump() from the binary
+        file object passed as parameter, yielding each unpickled value.
+        """
+        length = cls._DUMP_LENGTH
+
+        for _ in range(count):
+            size, = length.unpack(cls._read_exactly(fp, length.size))
+            yield pickle.loads(cls._read_exactly(fp, size))
+
+    @staticmethod
+    def _read_exactly(fp, size):
+        """
+        Reads and returns size bytes from the binary file object passed as
+        parameter, raising a ValueError if the file ends before.
+        """
+        data = fp.read(size)
+
+        if len(data) != size:
+            raise ValueError('The dump is truncated.')
+
+        return data
+
+    def _index_of_node(self, node):
+        """ 
+        Returns the list index of a node that belongs to this list,
+        which is its stored index minus the list base.
+        """
+        return node._idx - self._base
+
+    def _link_chain(self, iterable, idx):
+        """
+        Converts each value in the iterable to a node if needed, assigns 
+        them consecutive stored indexes starting from idx and links them
+        in that order, registering them in the express lanes and value map
+        if the list keeps them.
+
+        Returns a tuple with the first and last nodes of the chain and the
+        amount of nodes in it. The first two are None if the iterable is 
+        empty. The last node's _next is always None.
+        """
+        first = SSLL_Node()
+        tail = first
+        start = idx
+
+        for node in iterable:
+            if not isinstance(node, SSLL_Node):
+                node = SSLL_Node(node)
+            node._idx = idx
+            idx += 1
+            tail._next = node
+            tail = node
+
+        if tail is first:
+            return None, None, 0
+
+        tail._next = None
+        head = first._next
+
+        if self._lanes is not None or self._value_map is not None:
+            for node in self._chain(head):
+                if self._lanes is not None:
+                    self._add_lane(node)
+                if self._value_map is not None:
+                    self._map_value(node)
+
+        return head, tail, idx - start
+
+    @staticmethod
+    def _chain(node):
+        """
+        Yields each node from the one passed as parameter to the end of
+        its chain. The next node is read before yielding, so the nodes 
+        can be relinked while they are traversed.
+        """
+        while node:
+            following = node._next
+            yield node
+            node = following
+
+    @staticmethod
+    def _release_chain(node):
+        """
+        Yields each node from the one passed as parameter to the end of
+        its chain, resetting their index and _next fields first, as pop()
+        does with the node it returns. Used on chains already detached
+        from the list, like the ones _unlink_head_chain() returns.
+        """
+        while node:
+            following = node._next
+            node._idx = None
+            node._next = None
+            yield node
+            node = following
+
+    def _get_fingerprint(self):
+        """
+        Returns the list fingerprint: the sum of the hash of each value
+        times _FP_BASE to the power of its index, modulo _FP_MOD. 
+        
+        If it was marked to be computed again, it is computed walking 
+        the list once, along with self._power.
+        """
+        if self._fingerprint is None:
+            fingerprint = 0
+            power = 1
+            self._opaque = False
+
+            for value in self:
+                fingerprint = (fingerprint + self._fingerprint_of(value) * power) % self._FP_MOD
+                power = power * self._FP_BASE % self._FP_MOD
+
+            self._fingerprint = fingerprint
+            self._power = power
+
+        return self._fingerprint
+
+    def _fingerprint_of(self, value):
+        """
+        Returns the hash a value adds to the fingerprint. Only values of
+        exactly the immutable types in _FP_TYPES, whose repr is equal if
+        and only if they are equal, are hashed. 
+        
+        Any other value adds 0 and marks the list as opaque: its repr may
+        match the one of a hashed value (a str subclass, for example) or
+        change in place, so __eq__() compares the values one by one instead
+        of trusting a fingerprint mismatch.
+        """
+        if type(value) in self._FP_TYPES:
+            return hash(value) % self._FP_MOD
+
+        self._opaque = True
+        return 0
+
     def _find_by_value(self, node):
         """ 
         Finds the nodes whose values' repr match the node value attribute.
@@ -624,7 +1677,28 @@ class SortedSinglyLL:
         Otherwise, it returns a tuple with one None reference and
         the reference to the previous value before the search ended.
         That is, a reference pointing to the last node of the list. 
+
+        If the list has express lanes, the search starts from the 
+        closest lane before the node instead of the head.
         """
+        if type(idx) is int and not 0 <= idx < self._idx:
+            return None, self._tail
+
+        idx += self._base
+
+        if self._lanes and idx > self._base:
+            lane = (idx - 1) - (idx - 1) % self._LANE_STRIDE
+
+            if lane >= self._base:
+                previous = self._lanes[lane]
+                current = previous._next
+
+                while current._idx != idx:
+                    previous = current
+                    current = current._next
+
+                return current, previous
+
         current = self._head
         previous = current
 
@@ -640,26 +1714,6 @@ class SortedSinglyLL:
 
         return None, previous
 
-    
-    class _SSLL_Iterator:
-        """ 
-        A lass to generate the iterator object when __iter__ 
-        is called. 
-        """
-        def __init__(self, head):
-            self._current = head
-
-        def __iter__(self):
-            return self
-
-        def __next__(self):
-            if not self._current:
-                raise StopIteration
-            else:
-                value = self._current.value
-                self._current = self._current._next
-                return value
-        
 
 class SSLL_Node:
     """ 
@@ -671,7 +1725,12 @@ class SSLL_Node:
 
     However, other objects can be passed as parameters, so this is a
     matter of personal preference.
+
+    Nodes use __slots__ instead of an instance dictionary, which cuts
+    the memory each one takes roughly by half on long lists.
     """
+    __slots__ = ('value', '_idx', '_next')
+
     def __init__(self, value=None):
         self.value = value
         self._idx = None
@@ -767,6 +1826,23 @@ if __name__ == '__main__':
     # ssll.set_nodes("Overwrite on", overwrite=True)  #
     # print(ssll)                                     # /set_nodes
 
+    # print(ssll)                                     # map_inplace
+    # ssll.map_inplace(lambda value: str(value) * 2)  #
+    # print(ssll)                                     # /map_inplace
+
+    # print(ssll2)                                    # filter_inplace
+    # ssll2.filter_inplace(lambda value:              #
+    #     isinstance(value, str))                     #
+    # print(ssll2)                                    #
+    # try:                                            #
+    #     ssll2.filter_inplace(lambda value: 1 / 0)   #
+    # except ZeroDivisionError:                       #
+    #     print(ssll2, len(ssll2))                    # /filter_inplace
+
+    # print(ssll2)                                    # remove_all
+    # print(ssll2.remove_all('Hello'))                #
+    # print(ssll2)                                    # /remove_all
+
     # ssll.dprint()                                   # dprint
     # ssll.dprint(all_nodes=True)                     # /dprint
 
@@ -777,6 +1853,10 @@ if __name__ == '__main__':
     # print(ssll2.indexOf(dummy2))                    #
     # print(ssll2.indexOf("Not in list"))             # /indexOf
 
+    # print(ssll.is_empty())                          # is_empty
+    # ssll.clear()                                    #
+    # print(ssll.is_empty())                          # /is_empty
+
     # print(ssll.valueOf(3))                          # valueOf
 
     # print(ssll)                                     # clear
@@ -837,6 +1917,34 @@ if __name__ == '__main__':
     # print(ssll)                                     #
     # print(ssll_clone)                               # /clone
 
+    # ordered = SortedSinglyLL(5, 1, 3, ordered=True) # add
+    # ordered.add(4)                                  #
+    # ordered.add(0)                                  #
+    # print(ordered)                                  # /add
+
+    # ordered = SortedSinglyLL(5, 1, 3, ordered=True) # slicing
+    # print(ordered[1:], ordered[1:]._ordered)        #
+    # print(ordered[::-1], ordered[::-1]._ordered)    # /slicing
+
+    # ordered = SortedSinglyLL(1, 2, 2, 2, 3, 5,      # bisect_left/right
+    #                          ordered=True)          #
+    # print(ordered.bisect_left(2))                   #
+    # print(ordered.bisect_right(2))                  #
+    # print(ordered.bisect_left(4))                   # /bisect_left/right
+
+    # words = SortedSinglyLL('pear', 'fig', 'banana', # iter_between
+    #                        'kiwi', key=len)         #
+    # print(words)                                    #
+    # print(list(words.iter_between(3, 4)))           #
+    # print(list(words.iter_between(4)))              # /iter_between
+
+    # with open('ssll.bin', 'wb') as fp:              # dump/load
+    #     ssll.dump(fp)                               #
+    # with open('ssll.bin', 'rb') as fp:              #
+    #     loaded = SortedSinglyLL.load(fp)            #
+    # print(loaded)                                   #
+    # print(loaded == ssll)                           # /dump/load
+
     # print(dummy.get_value())                        # get_value
     # print(dummy2.get_value())                       #
     # print(dummy3.get_value())                       # /get_value
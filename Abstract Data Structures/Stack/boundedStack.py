@@ -0,0 +1,336 @@
+import threading
+
+from modules.array import Array
+from modules.sortedSinglyLL import SSLL_Node
+
+class BoundedStack:
+    """
+    A fixed-capacity Stack that stores its values in a ring buffer: an
+    Array (the ctypes one in the modules folder) with a top pointer,
+    instead of one linked node per value.
+
+    Values are pushed to the slot the top points at, and the top moves
+    one slot forward, wrapping around at the end of the Array. Popping
+    moves it one slot back. So, pushing and popping never allocate nodes,
+    and the memory the stack takes is fixed by its capacity.
+
+    What happens when pushing to a full stack depends on the overflow
+    policy passed to the constructor:
+
+        'raise' : push() raises an OverflowError. This is the default.
+        'drop_oldest' : the value at the bottom of the stack is dropped
+                        to make room for the new one, which is what a
+                        bounded undo history needs.
+        'block' : push() waits until another thread pops a value, or
+                  until its timeout runs out, raising an OverflowError
+                  then. Every push, pop, clear, clone and split holds a
+                  lock in this mode.
+
+    It has the same API as Stack: push, pop, peek, clone and split work
+    the same, iteration goes from the top to the bottom, and it prints
+    out the same way. Since there are no nodes, nodes pushed are stored
+    by their value, and pop() and peek() return new, unlinked SSLL_Nodes
+    holding the value.
+
+    Attributes:
+        self._values : Array holding the values.
+        self._capacity : Amount of values the stack can hold.
+        self._overflow : The overflow policy.
+        self._top : Slot the next value will be pushed to.
+        self._length : Amount of values in the stack.
+        self._not_full : Condition variable push() waits on, or None
+                         unless the overflow policy is 'block'.
+
+    Methods:
+        __init__
+        __len__
+        __str__
+        __iter__ : Generator that yields each value from the top to the
+                   bottom of the stack.
+        __eq__
+        get_capacity : Returns the amount of values the stack can hold.
+        is_empty : Returns True if the stack has no values.
+        is_full : Returns True if the stack holds as many values as its
+                  capacity.
+        clear : Removes all values from the stack.
+        clone : Creates and returns a shallow copy of the stack.
+        peek : Returns a node holding the value at the top of the stack.
+        pop : Removes the value at the top of the stack and returns a node
+              holding it.
+        push : Adds a value/node to the top of the stack.
+        split : Splits the stack in two starting at the given index,
+                counting from the top.
+        _push : Stores a value at the top, applying the overflow policy.
+        _pop : Removes and returns the value at the top.
+        _clear : Removes all values, without locking.
+        _split : Moves the values from an index onwards to a new stack,
+                 without locking.
+        _slot : Returns the slot of an index counting from the top.
+    """
+
+    _POLICIES = ('raise', 'drop_oldest', 'block')
+
+    def __init__(self, capacity, *args, overflow='raise'):
+        """
+        Creates an Array of the capacity passed as parameter and stores
+        the values passed as args in it. As in Stack, the first one ends
+        up at the top of the stack and the last one at the bottom.
+
+        The args never wait for room, not even with 'block', since no other
+        thread can pop them yet: if there are more of them than capacity,
+        an OverflowError is raised, or the bottom ones are dropped with
+        'drop_oldest'.
+        """
+        assert type(capacity) is int and capacity > 0, \
+            'Capacity must be an integer greater than 0.'
+
+        if overflow not in self._POLICIES:
+            raise ValueError(f'Overflow policy must be one of {", ".join(self._POLICIES)}.')
+
+        self._values = Array(capacity)
+        self._capacity = capacity
+        self._overflow = overflow
+        self._top = 0
+        self._length = 0
+        self._not_full = threading.Condition() if overflow == 'block' else None
+
+        for arg in reversed(args):
+            self._push(arg.value if isinstance(arg, SSLL_Node) else arg)
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return "<TOP> " + ' <- '.join([str(value) for value in self]) + ' <END>'
+
+    def __iter__(self):
+        values = self._values._values
+
+        for i in range(self._length):
+            yield values[self._slot(i)]
+
+    def __eq__(self, other):
+        """
+        Returns True if both stacks hold values with the same repr in the
+        same order. other can be any iterable stack, like a Stack.
+        """
+        if len(self) != len(other):
+            return False
+
+        for one, two in zip(self, other):
+            if repr(one) != repr(two):
+                return False
+
+        return True
+
+    def get_capacity(self):
+        """
+        Returns the amount of values the stack can hold.
+        """
+        return self._capacity
+
+    def is_empty(self):
+        """
+        Returns True if the stack has no values.
+        """
+        return self._length == 0
+
+    def is_full(self):
+        """
+        Returns True if the stack holds as many values as its capacity.
+        """
+        return self._length == self._capacity
+
+    def clear(self):
+        """
+        Removes all values from the stack, releasing their references.
+        """
+        if self._not_full is None:
+            self._clear()
+            return
+
+        with self._not_full:
+            self._clear()
+            self._not_full.notify_all()
+
+    def clone(self):
+        """
+        Creates and returns a shallow copy of the stack, with its same
+        capacity and overflow policy.
+        """
+        if self._not_full is None:
+            return BoundedStack(self._capacity, *self, overflow=self._overflow)
+
+        with self._not_full:
+            return BoundedStack(self._capacity, *self, overflow=self._overflow)
+
+    def peek(self):
+        """
+        Returns a new SSLL_Node holding the value at the top of the stack,
+        or None if the stack is empty.
+        """
+        if not self._length:
+            return None
+
+        return SSLL_Node(self._values._values[self._slot(0)])
+
+    def pop(self):
+        """
+        Removes the value at the top of the stack and returns a new
+        SSLL_Node holding it.
+        """
+        if self._not_full is None:
+            return SSLL_Node(self._pop())
+
+        with self._not_full:
+            value = self._pop()
+            self._not_full.notify()
+
+        return SSLL_Node(value)
+
+    def push(self, node_or_value, timeout=None):
+        """
+        Pushes the value, or the value of the node, passed as parameter to
+        the top of the stack.
+
+        If the stack is full, the overflow policy is applied. With 'block',
+        push() waits for as many seconds as timeout (forever if it is None)
+        for another thread to pop a value.
+        """
+        value = node_or_value.value if isinstance(node_or_value, SSLL_Node) else node_or_value
+
+        if self._not_full is None:
+            self._push(value)
+            return
+
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: self._length < self._capacity, timeout):
+                raise OverflowError('Stack is full.')
+
+            self._push(value)
+
+    def split(self, idx):
+        """
+        Splits the stack into two, where the second half starts with the
+        index passed as a parameter, counting from the top. That is, the
+        bottom values from that index onwards are moved to a new stack with
+        the same capacity and overflow policy, which is returned.
+
+        A valid split can only occur from index 1 onwards.
+        """
+        if self._not_full is None:
+            return self._split(idx)
+
+        with self._not_full:
+            second_half = self._split(idx)
+            self._not_full.notify_all()
+
+        return second_half
+
+    def _clear(self):
+        """
+        Removes all values from the stack. The caller holds the lock, if
+        there is one.
+        """
+        self._values.clear()
+        self._top = 0
+        self._length = 0
+
+    def _split(self, idx):
+        """
+        Moves the bottom values from the index passed as parameter onwards
+        to a new stack, and returns it. The caller holds the lock, if there
+        is one.
+        """
+        assert self._length, 'Stack is empty.'
+        assert idx != 0, \
+            "Cannot split from the top, it must be from the second value onwards."
+
+        if type(idx) is not int or not 0 < idx < self._length:
+            raise IndexError('Index out of range.')
+
+        values = self._values._values
+        second_half = BoundedStack(self._capacity, overflow=self._overflow)
+
+        for i in range(self._length - 1, idx - 1, -1):
+            slot = self._slot(i)
+            second_half._push(values[slot])
+            values[slot] = None
+
+        self._length = idx
+        return second_half
+
+    def _push(self, value):
+        """
+        Stores the value in the slot the top points at and moves the top
+        one slot forward. If the stack is full, it raises an OverflowError
+        or, with 'drop_oldest', overwrites the bottom value, which is the
+        one in that slot.
+        """
+        if self._length == self._capacity:
+            if self._overflow != 'drop_oldest':
+                raise OverflowError('Stack is full.')
+        else:
+            self._length += 1
+
+        self._values._values[self._top] = value
+        self._top = (self._top + 1) % self._capacity
+
+    def _pop(self):
+        """
+        Moves the top one slot back and returns the value in it, releasing
+        its reference.
+        """
+        assert self._length, 'Stack is empty.'
+
+        self._top = (self._top - 1) % self._capacity
+        self._length -= 1
+        values = self._values._values
+        value = values[self._top]
+        values[self._top] = None
+        return value
+
+    def _slot(self, idx):
+        """
+        Returns the slot holding the value at the index passed as
+        parameter, counting from the top of the stack.
+        """
+        return (self._top - 1 - idx) % self._capacity
+
+
+if __name__ == '__main__':
+
+
+    #######################################################
+    ####  Uncomment each segments of code down below,  ####
+    ####  one segment at a time, to test the methods.  ####
+    #######################################################
+
+
+    bs = BoundedStack(5, True, 1, None, [1,2])
+
+    print(bs)                                       # __str__
+
+    # bs.push('Fits')                                 # push
+    # print(bs)                                       #
+    # bs.push("Doesn't fit")                          # /push
+
+    # history = BoundedStack(3, overflow='drop_oldest')
+    # for action in ('type', 'bold', 'erase', 'paste'):  # drop_oldest
+    #     history.push(action)                        #
+    # print(history)                                  #
+    # print(history.pop())                            #
+    # print(history)                                  # /drop_oldest
+
+    # print(bs.peek())                                # peek
+    # print(bs.pop())                                 # pop
+    # print(bs)                                       # /pop
+
+    # half_stack = bs.split(2)                        # split
+    # print(bs)                                       #
+    # print(half_stack)                               # /split
+
+    # clone = bs.clone()                              # clone
+    # clone.pop()                                     #
+    # print(bs)                                       #
+    # print(clone)                                    # /clone
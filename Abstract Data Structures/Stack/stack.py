@@ -15,13 +15,17 @@ class Stack(SortedSinglyLL):
         peek : Returns a reference to the top of the stack.
         pop : Removes the node from the top of the stack and returns
               a reference to it.
+        pop_many : Removes a number of nodes from the top of the stack
+                   in one step and returns them.
         push : Adds a node to the top of the stack.
+        push_many : Adds all values/nodes in an iterable to the top of
+                    the stack in one step.
         split : Overrides super().split() so that both halves can be
                 returned as Stack instances.
     """
 
-    def __init__(self, *args):
-        super().__init__(*args)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
     def clear(self):
         """
@@ -34,17 +38,16 @@ class Stack(SortedSinglyLL):
         """ 
         Clones the Stack and returns an a reference to the new one.
 
-        _stack_instance is a private variable used by self.split().
-        Do not assign a value to it unless you are trying to clone 
-        another stack using this instance's method, in which case, 
-        it is more practical to use that other stack's own split().
+        _stack_instance is a private variable to clone the nodes of another
+        stack using this instance's method. Do not assign a value to it,
+        it is more practical to use that other stack's own clone().
 
         This method is intended to override super().clone(), as that
         class clone() returns the second half of the list as an
         instance of itself, and not of its children's (we need a
         Stack to be returned, not a SortedSinglyLL).
         """
-        clone = Stack()
+        clone = Stack(**self._options())
         current = _stack_instance._head if _stack_instance else self._head
         
         while current:
@@ -63,18 +66,53 @@ class Stack(SortedSinglyLL):
     def pop(self):
         """
         Removes the top element from the stack and returns a reference to it.
+
+        The top is the head of the list, which is unlinked in constant time
+        without reindexing the rest of the stack.
         """
-        head = super().pop(0)
-        return head
+        return self._unlink_head()
 
     def push(self, node_or_value):
         """
         Pushes the object passed as a parameter to the top of the stack.
 
         If the object is not a valid node instance, it is converted to one.
+        It is prepended to the list, which only moves the list base instead
+        of reindexing the rest of the stack, so it runs in constant time.
+        """
+        self.prepend(node_or_value)
+
+    def pop_many(self, count=None, lazy=False):
+        """
+        Removes count elements from the top of the stack (all of them if
+        count is None or greater than the stack length) and returns them,
+        from the top down, in a list. If lazy=True, a generator that yields
+        them is returned instead.
+
+        The elements are unlinked from the stack as a single chain, moving
+        the list base once, instead of popping them one at a time. An empty
+        stack, or a count of 0, returns no elements.
+        """
+        if not self._head or count == 0:
+            return iter(()) if lazy else []
+
+        head = self._unlink_head_chain(self._idx if count is None else count)
+        nodes = self._release_chain(head)
+        return nodes if lazy else list(nodes)
+
+    def push_many(self, iterable):
+        """
+        Pushes all objects in the iterable passed as parameter to the top 
+        of the stack, in that order. That is, the last one of them ends up
+        at the top, as if they were pushed one at a time.
+
+        Objects that are not valid node instances are converted to ones.
+        They are linked to each other in a single pass, and the chain is
+        prepended to the stack in one step.
         """
-        node = self._nodify(node_or_value)
-        self.prepend(node)
+        values = list(iterable)
+        values.reverse()
+        self.insert_many(0, values)
 
     def split(self, idx):
         """
@@ -83,15 +121,12 @@ class Stack(SortedSinglyLL):
 
         A valid split can only occur from index 1 onwards. 
 
-        This method is the only one intended to assign a different parameter
-        to clone(), since it is required to pass the second half of the list 
-        as a Stack instance, thus overriding the default parent class it 
-        would normally return. Check the behaviour of super().split(idx)
-        for a better understanding.
+        super().split(idx) detaches the second half without copying it, 
+        and returns it as a SortedSinglyLL. The new Stack adopts that
+        chain as it is, so no node is cloned and splitting only costs the
+        walk to the split point.
         """
-        splitted = super().split(idx)
-        second_half_clone = self.clone(splitted)
-        return second_half_clone
+        return self._adopt(super().split(idx))
 
     def __str__(self):
         return super().__str__(start="<TOP> ", end=' <END>', separator='<-')
@@ -100,8 +135,8 @@ class Stack(SortedSinglyLL):
     ################################################################
     # Uncomment the methods below if you really want to restrict   #
     # this class to the default basic behavior of a Stack. Note,   #
-    # however, that clone() and split() methods will stop working  #
-    # since they depend on super().append(), and it will be        #
+    # however, that the clone() method will stop working, since    #
+    # it depends on super().append(), and it will be               #
     # overwritten.                                                 #
     # If you choose to activate all of the following methods, then #
     # only clear(), peek(), pop() and push() -as well as all other #
@@ -151,6 +186,15 @@ if __name__ == '__main__':
     # s.pop()                             #    
     # print(s)                            # /pop
 
+    # s.push_many(range(5))               # push_many
+    # print(s)                            # /push_many
+
+    # print(s.pop_many(3))                # pop_many
+    # print(s)                            #
+    # for node in s.pop_many(lazy=True):  #
+    #     print(node)                     #
+    # print(s)                            # /pop_many
+
     # print(s)                            # peek
     # top = s.peek()                      #    
     # print(top)                          #